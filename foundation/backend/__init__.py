@@ -2,5 +2,7 @@ from .apps import *
 from .base import *
 from .controllers import *
 from .decorators import *
+from .paginator import *
+from .search import *
 from .viewsets import *
 from . import views
@@ -7,9 +7,10 @@ from collections import OrderedDict
 from django.conf import settings
 from django.conf.urls import url, include
 from django.forms.widgets import MediaDefiningClass
-from django.urls import resolve
+from django.urls import NoReverseMatch, reverse
 from django.utils import six
 from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
 
 from .. import utils
 from .registry import NotRegistered
@@ -38,13 +39,21 @@ class Backend(six.with_metaclass(MediaDefiningClass, Router)):
         It may seem like this should need the request but the plan is to make
         a SiteBackend registry at some point... for now we will assume one site.
         """
-        from django.contrib.sites.models import Site
-        return Site.objects.get(pk=settings.SITE_ID)
+        return self.get_site()
 
     @property
     def site_title(self):
         return self.site.name
 
+    def get_site(self, request=None):
+        """
+        Returns the Site for SITE_ID or, when that is not set, the request host.
+        Sites are cached by the sites framework, which clears its cache when
+        one is saved or deleted.
+        """
+        from django.contrib.sites.models import Site
+        return Site.objects.get_current(request)
+
     def __init__(self, *args, **kwargs):
         '''
         self.name = name
@@ -52,6 +61,9 @@ class Backend(six.with_metaclass(MediaDefiningClass, Router)):
         self._global_actions = self._actions.copy()
         '''
         self.backend = self
+        self._app_index = None
+        self._urls = None
+        self.urls_build_count = 0
         super(Backend, self).__init__(*args, **kwargs)
 
     def register(self, model_or_iterable, controller_class=None, **options):
@@ -76,6 +88,11 @@ class Backend(six.with_metaclass(MediaDefiningClass, Router)):
             model_or_iterable = [model_or_iterable]
         for model in model_or_iterable:
             super(Backend, self).register(controller_class, model, **options)
+        self.invalidate_urls()
+
+    def unregister(self, model_or_iterable):
+        super(Backend, self).unregister(model_or_iterable)
+        self.invalidate_urls()
 
     @cached_property
     def _routes(self):
@@ -196,8 +213,11 @@ class Backend(six.with_metaclass(MediaDefiningClass, Router)):
                     kwargs = func(request)
                     kwargs.update(self.each_context(request))
                     return kwargs
+                each_context.backend = self
                 return each_context
-            self.admin_site.each_context = context_wrapper(self.admin_site.each_context)
+            # do not re-wrap when the urls are rebuilt
+            if getattr(self.admin_site.each_context, 'backend', None) is not self:
+                self.admin_site.each_context = context_wrapper(self.admin_site.each_context)
             urlpatterns += [
                 url(r'^{}/'.format(self.admin_url_prefix)
                     if self.admin_url_prefix
@@ -231,39 +251,87 @@ class Backend(six.with_metaclass(MediaDefiningClass, Router)):
 
         return urlpatterns
 
+    def get_app_url(self, app_config):
+        """
+        Returns the URL of an app's root, i.e. its index or else the list of a
+        controller mounted there, reversed in the app's namespace so that any
+        prefix the backend's URLs are included under is honoured, or None.
+        """
+        namespace = getattr(app_config, 'url_namespace', app_config.label)
+        names = ['{}:index'.format(namespace)]
+        for model in app_config.get_models():
+            if self.has_registered_controller(model):
+                controller = self.get_registered_controller(model)
+                if not controller.url_prefix:
+                    names.append('{}:{}:list'.format(
+                        namespace, controller.model_namespace))
+        for name in names:
+            try:
+                return reverse(name)
+            except NoReverseMatch:
+                continue
+        return None
+
+    def get_app_index(self):
+        """
+        Returns an immutable, label-sorted tuple of (app_config, url) pairs for
+        the project apps with a root URL.
+        """
+        app_index = []
+        for app_config in sorted(utils.get_project_app_configs(),
+                                 key=lambda app_config: app_config.label):
+            app_url = self.get_app_url(app_config)
+            if app_url is not None:
+                app_index.append((app_config, app_url))
+        return tuple(app_index)
+
+    @property
+    def app_index(self):
+        if self._app_index is None:
+            self._app_index = self.get_app_index()
+        return self._app_index
+
     @property
     def urls(self):
         """
-        Shortcut for referencing backend URLs as ROOT_URLCONF
+        Shortcut for referencing backend URLs as ROOT_URLCONF.  The pattern
+        tree is built once and frozen until invalidate_urls() is called.
+        """
+        if self._urls is None:
+            self.urls_build_count += 1
+            if self.urls_build_count > 1:
+                logger.warning('Rebuilding URL patterns for %r (build %d)',
+                               self, self.urls_build_count)
+            else:
+                logger.info('Building URL patterns for %r', self)
+            self._urls = tuple(self.get_urlpatterns())
+        return self._urls
+
+    def invalidate_urls(self):
         """
-        return self.get_urlpatterns()
+        Drops the cached URL patterns and app index so they are rebuilt on
+        next access.  Must be called when registration changes after the URLs
+        were built.
+        """
+        self._urls = None
+        self._app_index = None
 
     def get_available_apps(self, request):
         """
         Returns a sorted list of all the installed apps that have been
-        registered in this site.
+        registered in this site.  The result is memoized on the request.
         """
 
-        user = request.user
-        available_apps = OrderedDict()
-        for app_config in sorted(utils.get_project_app_configs(),
-                                 key=lambda app_config: app_config.label):
-            is_visible = False
-            if app_config.has_public_views:
-                is_visible = True
-            elif user.has_module_perms(app_config.label):
-                is_visible = True
-            if is_visible:
-                url_prefix = getattr(app_config, 'url_prefix', None)
-                if url_prefix is None:
-                    url_prefix = app_config.label
-                try:
-                    url = '/{}/'.format(url_prefix)
-                    resolve(url)
-                except:
-                    pass
-                else:
-                    available_apps[app_config] = url
+        available_apps = getattr(request, '_available_apps', None)
+        if available_apps is None:
+            user = request.user
+            available_apps = OrderedDict(
+                (app_config, app_url)
+                for app_config, app_url in self.app_index
+                if app_config.has_public_views
+                or user.has_module_perms(app_config.label)
+            )
+            request._available_apps = available_apps
 
         return available_apps
 
@@ -277,7 +345,7 @@ class Backend(six.with_metaclass(MediaDefiningClass, Router)):
             'backend': self,
             'has_admin_urls': self.admin_site is not None,
             'has_auth_urls': self.auth_url_prefix is not None,
-            'site_title': self.site_title,
+            'site_title': self.get_site(request).name,
             'available_apps': self.get_available_apps(request),
         }
 
@@ -299,7 +367,13 @@ backends = []
 
 
 def get_backend(site=None):
+    """
+    Returns the default backend, made on first use from the class named by the
+    FOUNDATION_BACKEND setting (Backend when not set).
+    """
     global backends
     if not backends:
-        backends.append(Backend())
+        backend_class = getattr(settings, 'FOUNDATION_BACKEND', None)
+        backends.append(import_string(backend_class)() if backend_class
+                        else Backend())
     return backends[0]
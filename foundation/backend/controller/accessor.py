@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldDoesNotExist
 from django.forms.models import _get_foreign_key
 from django.utils import six
 from django.utils.functional import cached_property
@@ -27,10 +28,40 @@ class ModelAccessor(object):
         """
         return None
 
+    def get_related_field_names(self):
+        """
+        Hook returning the names of the fields that will be rendered, whose
+        relations should be fetched along with the objects.
+        """
+        return ()
+
+    def get_related_lookups(self):
+        """
+        Returns a tuple of the select_related and prefetch_related lookups for
+        the related fields to be rendered.  Reverse relations to children are
+        left out since children query (and paginate) their own objects.
+        """
+        opts = self.model._meta
+        child_models = set(child.model for child in self.children) | set(
+            inline.model for inline in self.inlines)
+        select_related, prefetch_related = [], []
+        for name in self.get_related_field_names():
+            try:
+                field = opts.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            if not field.is_relation:
+                continue
+            if field.many_to_one or field.one_to_one:
+                select_related.append(name)
+            elif field.related_model not in child_models:
+                prefetch_related.append(name)
+        return select_related, prefetch_related
+
     def get_root_queryset(self):
         """
-        Get a queryset for this Controller/View, applying ordering and injecting
-        view/controller, as required.
+        Get a queryset for this Controller/View, applying ordering and related
+        lookups and injecting view/controller, as required.
         """
 
         queryset = self.get_associated_queryset()
@@ -43,6 +74,12 @@ class ModelAccessor(object):
                 ordering = (ordering,)
             queryset = queryset.order_by(*ordering)
 
+        select_related, prefetch_related = self.get_related_lookups()
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
         return queryset
 
     @cached_property
@@ -45,23 +45,25 @@ class BaseController(ModelAccessor, ModelResolver):
             self.model = controller.model
         super(BaseController, self).__init__(**kwargs)
 
-    def __getattribute__(self, name):
+    def __getattr__(self, name):
         """
         When a normal lookup fails, perform a secondary lookup in the model.
+        Only called on a miss so regular attribute access stays fast.
         """
-        super_getattr = super(BaseController, self).__getattribute__
-
+        if name.startswith('__'):
+            raise AttributeError(name)
         try:
-            return super_getattr(name)
-        except AttributeError as e:
-            model = super_getattr('model')
-            if not model:
-                raise ImproperlyConfigured('Controller should have model by now.')
+            model = object.__getattribute__(self, 'model')
+        except AttributeError:
+            model = None
+        if not model:
+            raise ImproperlyConfigured('Controller should have model by now.')
 
-            try:
-                return getattr(model._meta, name)
-            except AttributeError:
-                raise e
+        try:
+            return getattr(model._meta, name)
+        except AttributeError:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                type(self).__name__, name))
 
     def get_empty_value_display(self):
         """
@@ -1,38 +1,129 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from django.core.exceptions import ValidationError, FieldError
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+
+from ...cache import get_versioned_key
 
 __all__ = 'SingleObjectMixin', 'MultipleObjectMixin'
 
 
+def clear_related_caches(obj):
+    """
+    Drops the related objects (select_related, prefetch_related or simply
+    accessed) held by obj, which would go stale if obj outlived the request.
+    """
+    for field in obj._meta.get_fields():
+        if field.is_relation and hasattr(field, 'get_cache_name'):
+            obj.__dict__.pop(field.get_cache_name(), None)
+    obj.__dict__.pop('_prefetched_objects_cache', None)
+
+
 class SingleObjectMixin(object):
 
-    def get_object(self, queryset=None):
+    def get_object_lookup(self):
+        """
+        Returns the filter kwargs for the object named by the URL, or None if
+        it names none, raising ValidationError for a value of the wrong type.
+        """
+        object_id = self.view.kwargs.get(self.controller.model_lookup)
+        if not object_id:
+            return None
+        return self.controller.object_lookup.resolve(object_id)
 
-        # Use a custom queryset if provided; this is required for subclasses
-        # like DateDetailView
-        if queryset is None:
-            queryset = self.get_queryset()
+    def get_object_key(self):
+        """
+        Returns the hashable key of the object named by the URL, or None if
+        it names none (or an invalid value).
+        """
+        try:
+            lookup = self.get_object_lookup()
+        except ValidationError:
+            return None
+        return tuple(sorted(lookup.items())) if lookup else None
 
-        model = queryset.model
+    def get_object_queryset(self):
+        """ Returns the queryset the URL's object is fetched from. """
+        return self.get_queryset()
 
-        object_id = self.view.kwargs.get(self.controller.model_lookup)
+    def get_object_cache_timeout(self):
+        """
+        Hook returning the seconds to cache the URL's object across requests,
+        or None to fetch it on every request.
+        """
+        return None
+
+    def get_object_cache_parts(self):
+        """
+        Hook returning what, besides the object's lookup, the object cached
+        across requests depends on (e.g. the parents it is served under).
+        """
+        return ()
+
+    def fetch_object(self, queryset, key):
+        """ Returns the object for the key from queryset, or None. """
+        try:
+            return queryset.get(**dict(key))
+        except queryset.model.DoesNotExist:
+            return None
+
+    def remember_object(self, obj):
+        """
+        Remembers obj, fetched elsewhere, as the URL's object for the rest of
+        the request, returning False (remembering nothing) if it is not.
+        """
+        key = self.get_object_key()
+        if key is None or any(getattr(obj, name) != value
+                              for name, value in key):
+            return False
+        self.__dict__.setdefault('_objects', {})[key] = obj
+        return True
+
+    def has_remembered_object(self):
+        key = self.get_object_key()
+        return key is not None and key in self.__dict__.get('_objects', ())
+
+    def get_object(self, queryset=None):
+        """
+        Returns the object named by the URL, or None.  Without a custom
+        queryset, it is fetched once per instance and, if the object cache
+        timeout is set, cached across requests until its model changes.
+        """
+
+        # a custom queryset (as required by subclasses like DateDetailView)
+        # is always queried
+        if queryset is not None:
+            key = self.get_object_key()
+            return self.fetch_object(queryset, key) if key else None
 
-        obj = None
-        if object_id:
-            # TODO come back and implement from_field
-            field = (
-                model._meta.pk 
-                if object_id.isdigit() 
-                else model._meta.get_field(self.slug_field)
-            )
-            try:
-                object_id = field.to_python(object_id)
-                obj = queryset.get(**{field.name: object_id})
-            except (model.DoesNotExist, ValidationError, ValueError, FieldError):
-                obj = None
+        queryset = self.get_object_queryset()
+        key = self.get_object_key()
+        if key is None:
+            return None
+        objects = self.__dict__.setdefault('_objects', {})
+        if key in objects:
+            return objects[key]
 
+        timeout = self.get_object_cache_timeout()
+        cache_key = (get_versioned_key('foundation.object', queryset.model, key,
+                                       self.get_object_cache_parts())
+                     if timeout else None)
+        obj = cache.get(cache_key) if cache_key else None
+        if obj is None:
+            if cache_key:
+                # the key is versioned by this model only, so leave out
+                # related rows
+                queryset = queryset.select_related(None).prefetch_related(None)
+            obj = self.fetch_object(queryset, key)
+            if obj is not None and cache_key:
+                clear_related_caches(obj)
+                cache.set(cache_key, obj, timeout)
+        elif queryset._association:
+            # the association is not pickled with the object
+            obj.associate(controller=queryset._controller,
+                          view_controller=queryset._view_controller)
+        objects[key] = obj
         return obj
 
 
@@ -1,11 +1,19 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+from collections import OrderedDict
+
 from django.conf.urls import url, include
-from django.core.paginator import Paginator
+from django.core.exceptions import FieldDoesNotExist
+from django.utils.functional import cached_property
 
+from ..cache import track_model_version
+from ..utils import get_composed_class
 from .controller import BaseController
+from .lookups import ObjectLookup
+from .paginator import Paginator
 from .router import Router
+from .search import ORMSearchBackend
 
 __all__ = 'Controller',
 
@@ -27,6 +35,7 @@ class PartialViewOptions(ModelOptions):
 
     fk_name = None
     slug_field = 'slug'
+    lookup_fields = None  # URL lookups in order, default ('pk', slug_field)
     model = None
     parent = None
 
@@ -37,16 +46,29 @@ class ViewOptions(PartialViewOptions):
     children = ()
     inlines = ()
 
-    # pagination options
+    # pagination options (paginator.CursorPaginator for keyset pagination)
     paginator_class = Paginator
     list_per_page = 20
     list_max_show_all = 200
     show_full_result_count = True
+    count_strategy = 'exact'  # or 'capped' or 'estimate' for huge tables
+    count_cap = 1000  # capped counts stop here; estimates above it are used
 
     # search options
     search_fields = ()
+    search_backend_class = ORMSearchBackend  # or search.IndexSearchBackend
     search_by_field = False  # when True, query from field names vs. SEARCH_VAR
 
+    # autocomplete options
+    autocomplete_limit = 20
+    autocomplete_cache_timeout = 60  # seconds, or 0 to disable
+
+    # seconds to cache objects of public display views, or 0 to disable
+    object_cache_timeout = 0
+
+    # seconds to cache {% controllercache %} fragments, or 0 to disable
+    fragment_cache_timeout = 0
+
 
 class ControllerOptions(ViewOptions):
     """ Configurable options for registered controllers. """
@@ -90,6 +112,24 @@ class Controller(ControllerOptions, Router, BaseController):
         # this Controller will be its own registered controller
         super(Controller, self).__init__(backend=backend, controller=self)
 
+        # compile the search and URL lookups now rather than on first use
+        self.search_plan
+        self.object_lookup
+
+        # cached objects, autocomplete results and fragments are invalidated
+        # by any change to the models they show
+        if self.object_cache_timeout or self.autocomplete_cache_timeout:
+            track_model_version(self.model)
+        if self.object_cache_timeout:
+            # cached objects are only served under their parents' lookups
+            parent = self.parent
+            while parent is not None:
+                track_model_version(parent.model)
+                parent = parent.parent
+        if self.fragment_cache_timeout:
+            for model in self.fragment_models:
+                track_model_version(model)
+
     @property
     def is_root(self):
         return self.parent is None
@@ -99,20 +139,61 @@ class Controller(ControllerOptions, Router, BaseController):
         return self.registrar is self.backend
 
     def check(self, **kwargs):
-        return (self.checks_class().check(self, **kwargs)
-                if self.checks_class else [])
+        errors = self.object_lookup.check(**kwargs)
+        if self.checks_class:
+            errors.extend(self.checks_class().check(self, **kwargs))
+        return errors
+
+    @cached_property
+    def search_backend(self):
+        return self.search_backend_class(self)
+
+    @cached_property
+    def search_plan(self):
+        return self.search_backend.get_plan(self.search_fields)
+
+    @cached_property
+    def object_lookup(self):
+        lookup_fields = self.lookup_fields
+        if lookup_fields is None:
+            lookup_fields = ('pk',)
+            try:
+                self.model._meta.get_field(self.slug_field)
+            except FieldDoesNotExist:
+                pass
+            else:
+                lookup_fields += (self.slug_field,)
+        return ObjectLookup(self.model, lookup_fields, url_field=self.slug_field)
+
+    @cached_property
+    def fragment_models(self):
+        """
+        The models shown by this controller's views, whose versions key their
+        cached fragments: its own, its parents' and its children's and inlines'.
+        """
+        models = [self.model]
+        parent = self.parent
+        while parent is not None:
+            models.append(parent.model)
+            parent = parent.parent
+        models.extend(child.model for child in self.children)
+        models.extend(inline.model for inline in self.inlines)
+        return tuple(OrderedDict.fromkeys(models))
 
     def get_associated_queryset(self):
         queryset = self.model._default_manager.get_queryset()
-        queryset.attach(controller=self)
+        return queryset.associate(controller=self)
+
+    def get_view_parent_class(self, view):
+        """ Returns the model-named ViewParent class, composed once. """
+        return get_composed_class(
+            '{}ViewParent'.format(self.model.__name__),
+            (view.view_parent_class,),
+            {'__module__': view.view_parent_class.__module__})
 
     def get_view_parent(self, view, kwargs):
-        view_parent = view.view_parent_class(
-            view=view, controller=self, kwargs=kwargs)
-        view_parent.__class__.__name__ =  str('{}ViewParent'.format(
-            view_parent.controller.model.__name__
-        ))
-        return view_parent
+        view_parent_class = self.get_view_parent_class(view)
+        return view_parent_class(view=view, controller=self, kwargs=kwargs)
 
     def get_view_child(self, view):
         view_child = view.view_child_class(view=view, controller=self)
@@ -135,8 +216,9 @@ class Controller(ControllerOptions, Router, BaseController):
             child_urlpatterns = child_controller.get_urlpatterns()
             for name, patterns in child_urlpatterns.items():
                 urlpatterns[name].append(
-                    url(r'^(?P<{lookup}>[-\w]+)/{prefix}'.format(
+                    url(r'^(?P<{lookup}>{pattern})/{prefix}'.format(
                             lookup=self.model_lookup,
+                            pattern=self.object_lookup.pattern,
                             prefix=child_prefix
                         ),
                         include((patterns, child_namespace))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import re
+
+from django.core import checks
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db import models
+
+__all__ = 'LookupField', 'ObjectLookup'
+
+INTEGER_PATTERN = r'\d+'
+UUID_PATTERN = r'[0-9a-fA-F]{8}-?(?:[0-9a-fA-F]{4}-?){3}[0-9a-fA-F]{12}'
+SLUG_PATTERN = r'[-\w]+'
+
+
+def get_field_pattern(field):
+    """ Returns the URL regex matching the values of a lookup field. """
+    if isinstance(field, (models.AutoField, models.IntegerField)):
+        return INTEGER_PATTERN
+    if isinstance(field, models.UUIDField):
+        return UUID_PATTERN
+    return SLUG_PATTERN
+
+
+class LookupField(object):
+    """ A field objects can be looked up by, with the regex of its values. """
+
+    __slots__ = 'field', 'pattern', 'regex'
+
+    def __init__(self, field):
+        self.field = field
+        self.pattern = get_field_pattern(field)
+        self.regex = re.compile(r'^(?:{})$'.format(self.pattern), re.UNICODE)
+
+    @property
+    def name(self):
+        return self.field.name
+
+    def matches(self, value):
+        return self.regex.match(value) is not None
+
+
+class ObjectLookup(object):
+    """
+    The fields by which a controller's objects are named in URLs, compiled
+    once.  A URL value is resolved by the first field (in order) whose regex
+    matches it, and URLs for an object use its url_field value if that field
+    is a lookup field, or else the first field's value.
+    """
+
+    def __init__(self, model, lookup_fields, url_field=None):
+        self.model = model
+        opts = model._meta
+        fields = []
+        for name in lookup_fields:
+            try:
+                fields.append(LookupField(
+                    opts.pk if name == 'pk' else opts.get_field(name)))
+            except FieldDoesNotExist:
+                raise ImproperlyConfigured(
+                    'The lookup field "{}" does not exist on {}.'.format(
+                        name, opts.label))
+        if not fields:
+            raise ImproperlyConfigured(
+                'At least one lookup field is required for {}.'.format(
+                    opts.label))
+        self.fields = tuple(fields)
+
+        # the resolver only dispatches values some lookup field can match
+        patterns = []
+        for lookup_field in self.fields:
+            if lookup_field.pattern not in patterns:
+                patterns.append(lookup_field.pattern)
+        self.pattern = (patterns[0] if len(patterns) == 1
+                        else '(?:{})'.format('|'.join(patterns)))
+
+        self.url_field = next(
+            (lookup_field.field for lookup_field in self.fields
+             if lookup_field.name == url_field),
+            self.fields[0].field)
+
+    def resolve(self, value):
+        """
+        Returns the filter kwargs for a URL value, or None if no lookup field
+        matches it, raising ValidationError if it cannot be converted.
+        """
+        for lookup_field in self.fields:
+            if lookup_field.matches(value):
+                field = lookup_field.field
+                return {field.name: field.to_python(value)}
+        return None
+
+    def get_url_value(self, obj):
+        """ Returns the value naming obj in URLs. """
+        value = getattr(obj, self.url_field.attname, None)
+        return obj.pk if value is None or value == '' else value
+
+    def check(self, **kwargs):
+        """ Lookup fields other than the pk must have a unique index. """
+        return [
+            checks.Error(
+                'The lookup field "{}" of {} is not unique.'.format(
+                    lookup_field.name, self.model._meta.label),
+                hint='Add unique=True to the field or remove it from '
+                     'lookup_fields.',
+                obj=self.model,
+                id='foundation.E001',
+            )
+            for lookup_field in self.fields
+            if not (lookup_field.field.primary_key or lookup_field.field.unique)
+        ]
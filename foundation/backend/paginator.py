@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import base64
+import datetime
+import decimal
+import json
+import uuid
+
+from django.core import paginator
+from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import EmptyPage, InvalidPage, PageNotAnInteger
+from django.db.models import Q
+from django.utils import six
+from django.utils.functional import cached_property
+
+__all__ = 'Paginator', 'CursorPaginator', 'CursorPage'
+
+
+class Page(paginator.Page):
+
+    def has_next(self):
+        # with an inexact count a full page may well be followed by another
+        if not self.paginator.count_is_exact:
+            return len(self) == self.paginator.per_page
+        return super(Page, self).has_next()
+
+
+class Paginator(paginator.Paginator):
+    """
+    Paginator whose count may be set from a capped or estimated count, in
+    which case pages past the count are still served rather than rejected.
+    """
+
+    count_is_exact = True
+
+    def set_count(self, count, exact=True):
+        self.count = count
+        self.count_is_exact = exact
+
+    def validate_number(self, number):
+        if self.count_is_exact:
+            return super(Paginator, self).validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger('That page number is not an integer')
+        if number < 1:
+            raise EmptyPage('That page number is less than 1')
+        return number
+
+    def page(self, number):
+        if self.count_is_exact:
+            return super(Paginator, self).page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        return self._get_page(
+            self.object_list[bottom:bottom + self.per_page], number, self)
+
+    def _get_page(self, *args, **kwargs):
+        return Page(*args, **kwargs)
+
+
+class CursorPage(object):
+    """
+    A page of a CursorPaginator.  object_list is the list of fetched rows, in
+    display order, so views and formsets can use it like the page of a regular
+    Paginator without querying again.
+    """
+
+    def __init__(self, object_list, paginator, cursor, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.cursor = cursor
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return '<Page after %r>' % (self.cursor,)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @cached_property
+    def next_cursor(self):
+        if not self.has_next():
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1])
+
+    @cached_property
+    def previous_cursor(self):
+        if not self.has_previous():
+            return None
+        return self.paginator.encode_cursor(self.object_list[0],
+                                          reverse=True)
+
+
+class CursorPaginator(object):
+    """
+    Keyset pagination over a queryset's ordering (made unique with a trailing
+    pk) using opaque cursor tokens rather than OFFSET, so deep pages cost the
+    same as the first.  Ordering fields must be non-null, non-relational model
+    fields, optionally spanning relations (e.g. "blog__title").
+    Signature-compatible with django.core.paginator.Paginator.
+    """
+
+    is_cursor = True
+
+    def __init__(self, object_list, per_page, orphans=0,
+                 allow_empty_first_page=True):
+        self.per_page = int(per_page)
+        self.orphans = int(orphans)
+        self.allow_empty_first_page = allow_empty_first_page
+        self.ordering = self.get_ordering(object_list)
+        self.object_list = object_list.order_by(*(
+            '-' + name if descending else name
+            for name, field, descending in self.ordering
+        ))
+
+    def get_ordering(self, queryset):
+        """
+        Returns a list of (lookup, field, descending) from the queryset (or
+        model) ordering, with the pk appended as a tie breaker.
+        """
+        opts = queryset.model._meta
+        ordering = list(queryset.query.order_by or opts.ordering or ())
+        resolved = []
+        for name in ordering:
+            if not isinstance(name, six.string_types) or name == '?':
+                raise ImproperlyConfigured(
+                    'CursorPaginator only supports ordering by field names, '
+                    'not {!r}.'.format(name))
+            descending = name.startswith('-')
+            name = name.lstrip('-')
+            if name == 'pk':
+                name = opts.pk.name
+            field = self._get_field(queryset.model, name)
+            resolved.append((name, field, descending))
+        if not any(field == opts.pk for name, field, descending in resolved):
+            descending = resolved[-1][2] if resolved else False
+            resolved.append((opts.pk.name, opts.pk, descending))
+        return resolved
+
+    @staticmethod
+    def _get_field(model, name):
+        field = None
+        for part in name.split('__'):
+            field = model._meta.get_field(part)
+            # NULLs neither compare nor sort consistently across databases so
+            # rows holding them would be skipped or repeated between pages
+            if field.null:
+                raise ImproperlyConfigured(
+                    'CursorPaginator cannot order by the nullable field '
+                    '"{}".'.format(name))
+            if field.is_relation:
+                model = field.related_model
+        if field.is_relation:
+            raise ImproperlyConfigured(
+                'CursorPaginator cannot order by the relation "{}".'.format(name))
+        return field
+
+    @staticmethod
+    def _get_value(obj, name):
+        for part in name.split('__'):
+            obj = getattr(obj, part)
+        return obj
+
+    def encode_cursor(self, obj, reverse=False):
+        values = []
+        for name, field, descending in self.ordering:
+            value = self._get_value(obj, name)
+            if isinstance(value, (datetime.date, datetime.time)):
+                value = value.isoformat()
+            elif isinstance(value, (decimal.Decimal, uuid.UUID)):
+                value = six.text_type(value)
+            values.append(value)
+        data = json.dumps({'v': values, 'r': reverse}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, cursor):
+        try:
+            data = json.loads(base64.urlsafe_b64decode(
+                cursor.encode('ascii')).decode('utf-8'))
+            values = data['v']
+            if len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                field.to_python(value)
+                for (name, field, descending), value in zip(self.ordering, values)
+            ], bool(data['r'])
+        except Exception:
+            raise InvalidPage('Invalid cursor.')
+
+    def get_keyset_query(self, values, reverse):
+        """
+        Returns a Q matching rows after (or, if reverse, before) the row with
+        the given ordering values.
+        """
+        query = Q()
+        for i, (name, field, descending) in enumerate(self.ordering):
+            after = descending == reverse
+            condition = Q(**{'{}__{}'.format(name, 'gt' if after else 'lt'): values[i]})
+            for j, (prior_name, prior_field, prior_descending) in enumerate(self.ordering[:i]):
+                condition &= Q(**{prior_name: values[j]})
+            query |= condition
+        return query
+
+    @cached_property
+    def count(self):
+        """ Only evaluated when a total is asked for. """
+        return self.object_list.count()
+
+    def page(self, cursor=None):
+        """
+        Returns the page following the cursor (or the first page), fetching
+        one extra row to learn whether another page exists.
+        """
+        reverse = False
+        queryset = self.object_list
+        if cursor:
+            values, reverse = self.decode_cursor(cursor)
+            queryset = queryset.filter(self.get_keyset_query(values, reverse))
+            if reverse:
+                queryset = queryset.reverse()
+
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if reverse:
+            rows.reverse()
+
+        return CursorPage(
+            rows, self, cursor,
+            has_next=has_more if not reverse else True,
+            has_previous=bool(cursor) and (has_more if reverse else True),
+        )
@@ -9,6 +9,11 @@ from django.db.models.base import ModelBase
 system_check_errors = []
 
 
+def check_controllers(app_configs=None, **kwargs):
+    """ Reports the errors found by controller checks at registration. """
+    return list(system_check_errors)
+
+
 class AlreadyRegistered(Exception):
     pass
 
@@ -79,8 +79,16 @@ class Router(Registry):
 
     @cached_property
     def all_modes(self):
-        """ Return all named modes across all routes for this controller. """
+        """
+        Return all named modes across all routes for this controller, less
+        those whose views are authorized by the permission of another mode
+        (their view class's permission_mode).
+        """
         modes = set()
         for route in self._modes:
-            modes |= set(self.get_modes(route))
+            viewset = self._viewsets[route]
+            for mode in self.get_modes(route):
+                view_class = getattr(viewset.get(mode), 'view_class', None)
+                if getattr(view_class, 'permission_mode', mode) == mode:
+                    modes.add(mode)
         return modes
@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import bisect
+import operator
+import re
+import threading
+from collections import defaultdict
+
+from django.contrib.admin.utils import get_fields_from_path
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.utils import six
+from django.utils.encoding import force_text
+
+if six.PY3:
+    from functools import reduce
+
+from ..cache import get_model_version, track_model_version
+from ..utils import lookup_needs_distinct
+
+__all__ = 'SearchPlan', 'SearchBackend', 'ORMSearchBackend', 'IndexSearchBackend'
+
+TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def tokenize(value):
+    return TOKEN_RE.findall(force_text(value).lower())
+
+
+# fields searched by equality with a coerced term rather than by text lookups
+EXACT_FIELD_TYPES = (
+    models.AutoField, models.IntegerField, models.FloatField,
+    models.DecimalField, models.DateField, models.TimeField, models.UUIDField,
+)
+
+
+class SearchLookup(object):
+    """ A search field resolved to its ORM lookup and term coercion. """
+
+    __slots__ = ('search_field', 'field', 'lookup', 'to_python',
+                 'needs_distinct', 'is_local_text')
+
+    def __init__(self, search_field, field, lookup, to_python=None,
+                 needs_distinct=False, is_local_text=False):
+        self.search_field = search_field
+        self.field = field
+        self.lookup = lookup
+        self.to_python = to_python
+        self.needs_distinct = needs_distinct
+        self.is_local_text = is_local_text
+
+    def get_q(self, bit):
+        """ Returns the Q for a term or None if the term cannot match. """
+        if self.to_python is not None:
+            try:
+                bit = self.to_python(bit)
+            except ValidationError:
+                return None
+        return models.Q(**{self.lookup: bit})
+
+
+class SearchPlan(object):
+    """
+    The search fields of a controller compiled once to their ORM lookups,
+    term coercion and de-duplication requirement, so that requests only bind
+    their terms.  Search fields are "icontains" unless prefixed with "^"
+    (istartswith), "=" (iexact) or "@" (the database's full-text "search"
+    lookup, where one is registered, e.g. by django.contrib.postgres), while
+    numeric, date, time and UUID fields are matched exactly.
+    """
+
+    def __init__(self, model, search_fields):
+        self.model = model
+        self.lookups = tuple(self.compile(search_field)
+                             for search_field in search_fields)
+        self.lookups_by_field = {lookup.search_field: lookup
+                                 for lookup in self.lookups}
+        self.needs_distinct = any(lookup.needs_distinct
+                                  for lookup in self.lookups)
+
+    def compile(self, search_field):
+        search_field = str(search_field)
+        prefix = search_field[:1] if search_field[:1] in '^=@' else ''
+        field_name = search_field[len(prefix):]
+        field = get_fields_from_path(self.model, field_name)[-1]
+        to_python = None
+
+        if isinstance(field, models.DateTimeField):
+            lookup = '%s__date' % field_name
+            to_python = models.DateField().to_python
+        elif isinstance(field, EXACT_FIELD_TYPES):
+            lookup = '%s__exact' % field_name
+            to_python = field.to_python
+        elif prefix == '^':
+            lookup = '%s__istartswith' % field_name
+        elif prefix == '=':
+            lookup = '%s__iexact' % field_name
+        elif prefix == '@' and 'search' in field.get_lookups():
+            lookup = '%s__search' % field_name
+        else:
+            lookup = '%s__icontains' % field_name
+
+        return SearchLookup(
+            search_field, field, lookup, to_python,
+            needs_distinct=lookup_needs_distinct(self.model._meta, field_name),
+            is_local_text=(prefix in ('', '^') and '__' not in field_name
+                           and isinstance(field, (models.CharField,
+                                                  models.TextField))),
+        )
+
+    def get_or_query(self, bit, lookups=None):
+        """ Returns a Q matching the term on any of the lookups, or None. """
+        or_queries = [q for q in (lookup.get_q(bit)
+                                  for lookup in lookups or self.lookups)
+                      if q is not None]
+        return reduce(operator.or_, or_queries) if or_queries else None
+
+    def filter(self, queryset, query):
+        """
+        Returns a tuple containing the queryset filtered for the query (every
+        term must match) and a boolean indicating if the results may contain
+        duplicates.
+        """
+        if isinstance(query, dict):
+            needs_distinct = False
+            for search_field, search_term in query.items():
+                if search_term:
+                    lookup = self.lookups_by_field[search_field]
+                    for bit in search_term.split():
+                        q = lookup.get_q(bit)
+                        if q is None:
+                            return queryset.none(), False
+                        queryset = queryset.filter(q)
+                    needs_distinct = needs_distinct or lookup.needs_distinct
+            return queryset, needs_distinct
+
+        if not (self.lookups and query):
+            return queryset, False
+        for bit in query.split():
+            q = self.get_or_query(bit)
+            if q is None:
+                return queryset.none(), False
+            queryset = queryset.filter(q)
+        return queryset, self.needs_distinct
+
+
+class SearchBackend(object):
+    """
+    Searches a controller's queryset for a query, which will be a string or,
+    with search_by_field, a dict of search field to term.
+    """
+
+    def __init__(self, controller):
+        self.controller = controller
+        self.model = controller.model
+        self._plans = {}
+
+    def get_plan(self, search_fields):
+        """ Returns the SearchPlan for the search fields, compiled once. """
+        search_fields = tuple(search_fields)
+        plan = self._plans.get(search_fields)
+        if plan is None:
+            plan = self._plans[search_fields] = SearchPlan(self.model, search_fields)
+        return plan
+
+    def get_search_results(self, queryset, query, search_fields):
+        """
+        Returns a tuple containing a queryset to implement the search,
+        and a boolean indicating if the results may contain duplicates.
+        """
+        raise NotImplementedError
+
+    def deduplicate(self, queryset, results):
+        """
+        Returns the rows of queryset whose pk is among the results, which
+        removes duplicates without a DISTINCT over the (wide) outer rows.
+        """
+        deduplicated = queryset.filter(pk__in=results.order_by().values('pk'))
+        if results.query.order_by:
+            deduplicated = deduplicated.order_by(*results.query.order_by)
+        return deduplicated
+
+    def search(self, queryset, query, search_fields):
+        """
+        Returns a tuple containing a queryset to implement the search,
+        free of duplicates, and False (kept for custom backends which may
+        still ask for distinct()).
+        """
+        results, may_duplicate = self.get_search_results(
+            queryset, query, search_fields)
+        if may_duplicate:
+            results = self.deduplicate(queryset, results)
+        return results, False
+
+
+class ORMSearchBackend(SearchBackend):
+    """ Filters with the SearchPlan's lookups, one OR-chain per term. """
+
+    def get_search_results(self, queryset, query, search_fields):
+        return self.get_plan(search_fields).filter(queryset, query)
+
+
+class InvertedIndex(object):
+    """
+    An in-process inverted index of token -> {pk: weight} over the given local
+    fields of a model, built on first use and kept current from post_save and
+    post_delete.  Writes that bypass signals (QuerySet.update, bulk_create
+    or raw SQL) are not seen until bump_model_version() or rebuild() is
+    called: the whole table is then read again, as it is whenever the model's
+    version (foundation.cache) moves past the process's own writes.
+
+    Each process holds the whole index, so it is meant for a single process
+    (e.g. one worker, or a management command): writes by other processes,
+    which are seen only through a shared cache, rebuild it on the next search.
+    """
+
+    _indexes = {}
+    _indexes_lock = threading.Lock()
+
+    def __init__(self, model, field_names):
+        self.model = model
+        self.field_names = field_names
+        self.lock = threading.RLock()
+        self.postings = None
+        self.version = None
+        self.documents = {}
+        self.tokens = []
+        # bump the version before the index is updated from the same signals
+        track_model_version(model)
+        self.dispatch_uid = 'foundation.search.{}.{}.{}'.format(
+            model._meta.label_lower, '.'.join(field_names), id(self))
+        post_save.connect(self.handle_save, sender=model, weak=False,
+                          dispatch_uid=self.dispatch_uid)
+        post_delete.connect(self.handle_delete, sender=model, weak=False,
+                            dispatch_uid=self.dispatch_uid)
+
+    @classmethod
+    def get_index(cls, model, field_names):
+        """ Returns the shared index for the model and (ordered) fields. """
+        key = model, tuple(field_names)
+        with cls._indexes_lock:
+            if key not in cls._indexes:
+                cls._indexes[key] = cls(model, tuple(field_names))
+            return cls._indexes[key]
+
+    def get_document(self, values):
+        """
+        Returns a dict of token to weight for a row, with earlier fields
+        weighing more than later ones.
+        """
+        document = defaultdict(int)
+        weight = len(self.field_names)
+        for value in values:
+            if value is not None:
+                for token in tokenize(value):
+                    document[token] += weight
+            weight -= 1
+        return dict(document)
+
+    def rebuild(self):
+        with self.lock:
+            self.version = get_model_version(self.model)
+            self.postings = defaultdict(dict)
+            self.documents = {}
+            rows = self.model._default_manager.values_list(
+                'pk', *self.field_names).iterator()
+            for row in rows:
+                self._add(row[0], self.get_document(row[1:]))
+            self.tokens = sorted(self.postings)
+
+    def _add(self, pk, document):
+        self.documents[pk] = document
+        for token, weight in document.items():
+            self.postings[token][pk] = weight
+
+    def _remove(self, pk):
+        for token in self.documents.pop(pk, ()):
+            postings = self.postings.get(token)
+            if postings is not None:
+                postings.pop(pk, None)
+                if not postings:
+                    del self.postings[token]
+                    index = bisect.bisect_left(self.tokens, token)
+                    if index < len(self.tokens) and self.tokens[index] == token:
+                        del self.tokens[index]
+
+    def _follow_version(self):
+        # the write was this process's own, and the only one, if it moved the
+        # version by exactly one; otherwise search() will rebuild
+        version = get_model_version(self.model)
+        if self.version is not None and version == self.version + 1:
+            self.version = version
+
+    def handle_save(self, sender, instance, raw=False, **kwargs):
+        with self.lock:
+            if self.postings is None:
+                return
+            self._follow_version()
+            self._remove(instance.pk)
+            document = self.get_document(
+                getattr(instance, name) for name in self.field_names)
+            self._add(instance.pk, document)
+            for token in document:
+                index = bisect.bisect_left(self.tokens, token)
+                if index == len(self.tokens) or self.tokens[index] != token:
+                    self.tokens.insert(index, token)
+
+    def handle_delete(self, sender, instance, **kwargs):
+        with self.lock:
+            if self.postings is not None:
+                self._follow_version()
+                self._remove(instance.pk)
+
+    def match(self, term):
+        """ Returns {pk: weight} for rows with a token starting with term. """
+        matches = defaultdict(int)
+        index = bisect.bisect_left(self.tokens, term)
+        while index < len(self.tokens) and self.tokens[index].startswith(term):
+            for pk, weight in self.postings[self.tokens[index]].items():
+                matches[pk] += weight
+            index += 1
+        return matches
+
+    def search(self, terms):
+        """
+        Returns the pks of the rows matching every term (by token prefix),
+        best ranked first.
+        """
+        with self.lock:
+            if (self.postings is None
+                    or self.version != get_model_version(self.model)):
+                self.rebuild()
+            scores = None
+            for term in terms:
+                matches = self.match(term)
+                if scores is None:
+                    scores = matches
+                else:
+                    scores = {pk: score + matches[pk]
+                              for pk, score in scores.items() if pk in matches}
+                if not scores:
+                    return []
+        if scores is None:
+            return []
+        return sorted(scores, key=lambda pk: -scores[pk])
+
+
+class IndexSearchBackend(ORMSearchBackend):
+    """
+    Answers plain and "^" search fields that are local text fields from an
+    InvertedIndex (matching whole-word prefixes rather than arbitrary
+    substrings) and orders results by rank; other search fields are still
+    searched through the ORM.  Searches matching more than max_results rows,
+    terms without word characters, and search_by_field queries use the ORM
+    path.
+
+    The index lives in each process and is rebuilt from the whole table after
+    another process writes, so use this backend only where a single process
+    serves the model (use ORMSearchBackend, or a search engine, otherwise).
+    """
+
+    max_results = 500
+    rank_limit = 100  # only the best ranked rows are ordered by rank
+
+    def get_search_results(self, queryset, query, search_fields):
+        plan = self.get_plan(search_fields)
+        indexed = [lookup.field.attname for lookup in plan.lookups
+                   if lookup.is_local_text]
+        if isinstance(query, dict) or not (indexed and query):
+            return plan.filter(queryset, query)
+
+        index = InvertedIndex.get_index(self.model, indexed)
+        unindexed = [lookup for lookup in plan.lookups
+                     if not lookup.is_local_text]
+        bits = query.split()
+        if not all(tokenize(bit) for bit in bits):
+            # the index has no tokens for these, while the ORM finds them
+            return plan.filter(queryset, query)
+        if unindexed:
+            # each bit may match the index or any ORM-searched field
+            bit_pks = [(bit, index.search(tokenize(bit))) for bit in bits]
+            if any(len(pks) > self.max_results for bit, pks in bit_pks):
+                return plan.filter(queryset, query)
+            for bit, pks in bit_pks:
+                q = models.Q(pk__in=pks)
+                or_query = plan.get_or_query(bit, unindexed)
+                queryset = queryset.filter(q | or_query if or_query else q)
+            return queryset, any(lookup.needs_distinct for lookup in unindexed)
+
+        pks = index.search([token for bit in bits for token in tokenize(bit)])
+        if len(pks) > self.max_results:
+            return plan.filter(queryset, query)
+        queryset = queryset.filter(pk__in=pks)
+        # keyset pagination needs plain field ordering, so it goes unranked
+        if pks and not getattr(self.controller.paginator_class, 'is_cursor', False):
+            rank = models.Case(
+                *[models.When(pk=pk, then=models.Value(i))
+                  for i, pk in enumerate(pks[:self.rank_limit])],
+                default=models.Value(self.rank_limit),
+                output_field=models.IntegerField()
+            )
+            ordering = queryset.query.order_by or self.model._meta.ordering
+            queryset = queryset.order_by(rank, *ordering)
+        return queryset, False
@@ -1,3 +1,4 @@
+from .autocomplete import *
 from .base import *
 from .list import *
 from .mixins.variables import *
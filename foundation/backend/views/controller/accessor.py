@@ -92,7 +92,7 @@ class ModelPermissionsMixin(AppPermissionsMixin):
             public_modes = permissions_controller.public_modes
         # default to only public, list view when an inline (no controller)
         else:
-            public_modes = modes = ('list')
+            public_modes = modes = ('list',)
 
         # process each mode
         view_permissions = []
@@ -119,9 +119,87 @@ class ModelPermissionsMixin(AppPermissionsMixin):
 
         return view_permissions
 
+    @cached_property
+    def permissions(self):
+        """
+        The set of modes permitted by get_permissions, computed once per view
+        controller and shared across view controllers of the same controller
+        and permissions model for the rest of the request.
+        """
+        request = self.view.request
+        cache = getattr(request, '_permissions_cache', None)
+        if cache is None:
+            cache = request._permissions_cache = {}
+        key = (self.controller, self.get_permissions_model())
+        if key not in cache:
+            cache[key] = frozenset(self.get_permissions())
+        return cache[key]
+
     def has_permission(self, mode):
         """
         Returns a boolean whether this ViewController has general access to a
         specified mode regardless of per-object permissions.
         """
-        return mode in self.get_permissions()
+        return mode in self.permissions
+
+    def get_permission_candidates(self):
+        """
+        Hook returning the pks of objects whose per-object permissions are
+        likely to be checked (e.g. the rows of a page) so they can be resolved
+        in one query, or None if there are none.
+        """
+        return None
+
+    @property
+    def permission_candidates(self):
+        """
+        The frozen permission candidates, remembered once the hook returns
+        them (it may return None until e.g. the formset exists).
+        """
+        candidates = self.__dict__.get('_permission_candidates')
+        if candidates is None:
+            candidates = self.get_permission_candidates()
+            if candidates is not None:
+                candidates = frozenset(candidates)
+                self.__dict__['_permission_candidates'] = candidates
+        return candidates
+
+    @property
+    def permitted_pks(self):
+        """
+        The subset of permission candidates within the private queryset,
+        fetched with a single query.
+        """
+        candidates = self.permission_candidates
+        if not candidates:
+            return frozenset()
+        if '_permitted_pks' not in self.__dict__:
+            self.__dict__['_permitted_pks'] = frozenset(
+                self.private_queryset.filter(
+                    pk__in=candidates).values_list('pk', flat=True))
+        return self.__dict__['_permitted_pks']
+
+    def has_object_permission(self, obj, mode):
+        """
+        Returns a boolean whether this ViewController has access to a mode for
+        a specific object, i.e. the mode is permitted and, unless public, the
+        object is in the private queryset.
+        """
+        if not self.has_permission(mode):
+            return False
+        if mode in self.public_modes:
+            return True
+
+        # objects of another model are never in the private queryset
+        if obj._meta.concrete_model != self.model._meta.concrete_model:
+            return False
+
+        candidates = self.permission_candidates
+        if candidates is not None and obj.pk in candidates:
+            return obj.pk in self.permitted_pks
+
+        # fallback to a single object check, remembered for this instance
+        checked = self.__dict__.setdefault('_object_permissions', {})
+        if obj.pk not in checked:
+            checked[obj.pk] = self.private_queryset.filter(pk=obj.pk).exists()
+        return checked[obj.pk]
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.http.response import HttpResponseBadRequest, JsonResponse
+from django.utils.encoding import force_text
+
+from ....cache import get_versioned_key
+from ...controller import MultipleObjectMixin
+from ..base import View
+from .base import ControllerViewMixin
+from .mixins.variables import SEARCH_VAR
+
+__all__ = 'AutocompleteMixin', 'AutocompleteView', 'TO_FIELD_VAR'
+
+TO_FIELD_VAR = '_to_field'
+
+
+class AutocompleteMixin(MultipleObjectMixin, ControllerViewMixin):
+    """
+    Returns JSON choices for a term from the auth-constrained queryset,
+    matching the controller's search fields by prefix so that indexes on them
+    can be used, capped at autocomplete_limit and cached per user and term.
+    """
+
+    mode = 'autocomplete'
+    # anyone who may list the objects may look them up, so the mode has no
+    # permission of its own
+    permission_mode = 'list'
+    parent_constrained = True
+    http_method_names = ['get']
+
+    def has_permission(self, mode):
+        if mode == self.mode:
+            mode = self.permission_mode
+        return super(AutocompleteMixin, self).has_permission(mode)
+
+    def get_search_fields(self):
+        """ The search fields, matching text by prefix. """
+        return tuple(
+            search_field
+            if search_field[:1] in ('=', '@')
+            else '^' + search_field.lstrip('^')
+            for search_field in self.search_fields
+        )
+
+    def to_field_allowed(self, field):
+        """
+        SOURCE: admin.options.BaseModelAdmin.to_field_allowed
+        Returns True if a relation to the model references the field, as
+        only then may a widget ask for its values (which could otherwise be
+        any unique field, e.g. a user's email).
+        """
+        for related_object in self.model._meta.get_fields(include_hidden=True):
+            if not (related_object.auto_created and
+                    not related_object.concrete):
+                continue
+            remote_field = related_object.field.remote_field
+            if (hasattr(remote_field, 'get_related_field') and
+                    remote_field.get_related_field() == field):
+                return True
+        return False
+
+    def get_to_field(self):
+        """
+        Returns the name of the field whose value identifies a choice, which
+        must be the pk or a field referenced by a relation, or None if it is
+        not.
+        """
+        to_field = self.request.GET.get(TO_FIELD_VAR)
+        opts = self.model._meta
+        if not to_field or to_field == opts.pk.name:
+            return opts.pk.attname
+        try:
+            field = opts.get_field(to_field)
+        except FieldDoesNotExist:
+            return None
+        if field == opts.pk or self.to_field_allowed(field):
+            return field.attname
+        return None
+
+    def get_cache_key(self, term, to_field):
+        # the path carries the parent lookups and the user the auth constraint
+        scope = 'su' if self.has_acting_superuser else self.user.pk
+        return get_versioned_key('foundation.autocomplete', self.model,
+                                 self.request.path, scope, to_field,
+                                 term.lower())
+
+    def get_results(self, term, to_field):
+        """ Returns a tuple of the result dicts and whether more exist. """
+        queryset = self.get_queryset()
+        search_fields = self.get_search_fields()
+        if term and search_fields:
+            queryset, use_distinct = self.controller.search_backend.search(
+                queryset, term, search_fields)
+            if use_distinct:
+                queryset = queryset.distinct()
+        elif term:
+            queryset = queryset.none()
+        objects = list(queryset[:self.autocomplete_limit + 1])
+        results = [
+            {'id': force_text(getattr(obj, to_field)), 'text': force_text(obj)}
+            for obj in objects[:self.autocomplete_limit]
+        ]
+        return results, len(objects) > self.autocomplete_limit
+
+    def get(self, request, *args, **kwargs):
+        to_field = self.get_to_field()
+        if to_field is None:
+            return HttpResponseBadRequest()
+        term = request.GET.get(SEARCH_VAR, '').strip()
+
+        timeout = self.autocomplete_cache_timeout
+        key = self.get_cache_key(term, to_field) if timeout else None
+        data = cache.get(key) if key else None
+        if data is None:
+            results, more = self.get_results(term, to_field)
+            data = {'results': results, 'more': more}
+            if key:
+                cache.set(key, data, timeout)
+
+        return JsonResponse(data)
+
+
+class AutocompleteView(AutocompleteMixin, View):
+    """ Autocomplete endpoint for a controller's objects. """
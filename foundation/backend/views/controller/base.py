@@ -2,16 +2,25 @@
 from __future__ import unicode_literals
 
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.utils.functional import cached_property
+from django.utils.six import get_unbound_function
 from django.shortcuts import resolve_url
 
+from ....cache import get_model_version
 from ...controller.base import BaseController
 from ...controller import MultipleObjectMixin, SingleObjectMixin
 from .accessor import ModelPermissionsMixin
 from .resolver import ChainingMixin
 from django.http.response import HttpResponseRedirect
 
-__all__ = 'ViewParent', 'ViewChild', 'ControllerViewMixin'
+__all__ = ('ChainedObjectMixin', 'ViewParent', 'ViewChild',
+           'ControllerViewMixin')
+
+# the hooks a view parent's queryset is built from
+QUERYSET_HOOKS = ('get_queryset', 'get_auth_queryset', 'get_auth_query',
+                  'is_auth_obj_permitted', 'get_root_queryset',
+                  'get_associated_queryset', 'get_related_lookups')
 
 
 class BaseViewController(ChainingMixin, ModelPermissionsMixin, BaseController):
@@ -53,20 +62,117 @@ class BaseViewController(ChainingMixin, ModelPermissionsMixin, BaseController):
         queryset = self.model._default_manager.get_queryset()
         return queryset.associate(view_controller=self)
 
-    def __getattribute__(self, name):
+    def __getattr__(self, name):
         """
-        When a normal lookup fails, perform a secondary lookup in the model.
+        When a normal lookup fails, perform a secondary lookup in the
+        registered controller (which in turn falls back to the model).
         """
-        super_getattr = super(BaseController, self).__getattribute__
+        if name.startswith('__'):
+            raise AttributeError(name)
+        controller = object.__getattribute__(self, 'controller')
+        if controller is None:
+            raise AttributeError("'{}' object has no attribute '{}'".format(
+                type(self).__name__, name))
+        return getattr(controller, name)
+
+
+class ChainedObjectMixin(SingleObjectMixin):
+    """
+    Fetches the URL's object along with the objects of its view parents,
+    which are then remembered by the view parents rather than queried again.
+    """
 
+    def get_ancestor_lookup(self):
+        """
+        Returns the select_related lookup following the FKs from this model up
+        through the view parents' models (e.g. "blog" for a post), or None.
+        """
+        # objects cached across requests would carry stale parents
+        if self.get_object_cache_timeout():
+            return None
+        names = []
+        view_controller = self
+        for view_parent in self.view_parents:
+            if view_parent.has_remembered_object():
+                break
+            names.append(view_controller.fk.name)
+            view_controller = view_parent
+        return '__'.join(names) or None
+
+    def get_ancestor_query(self):
+        """
+        Returns the filter kwargs constraining the object to the view parents
+        named by the URL (e.g. {"blog__slug": "red"} for a post), raising
+        ValidationError for a value of the wrong type.
+        """
+        query = {}
+        path = []
+        view_controller = self
+        for view_parent in self.view_parents:
+            lookup = view_parent.get_object_lookup()
+            if not lookup:
+                break
+            path.append(view_controller.fk.name)
+            for name, value in lookup.items():
+                query['__'.join(path + [name])] = value
+            view_controller = view_parent
+        return query
+
+    def get_object_cache_parts(self):
+        # the object is only served under its parents' URL lookups, which
+        # change with the parents' models
         try:
-            return super_getattr(name)
-        except AttributeError as e:
-            controller = super_getattr('controller')
-            try:
-                return getattr(controller, name)
-            except AttributeError:
-                raise e
+            query = self.get_ancestor_query()
+        except ValidationError:
+            query = None
+        return (sorted(query.items()) if query else None,
+                [get_model_version(view_parent.model)
+                 for view_parent in self.view_parents])
+
+    def share_ancestors(self, obj):
+        """
+        Hands the parents fetched along with obj to the view parents.  A
+        parent is only handed over if the URL names it and it is within the
+        view parent's queryset, which holds when obj was auth-constrained
+        along the FKs by the parent's own auth lookup and the parent builds
+        its queryset with the default hooks.
+        """
+        view_controller = self
+        for view_parent in self.view_parents:
+            if view_parent.has_remembered_object():
+                break
+            obj = getattr(obj, view_controller.fk.name)
+            if not view_parent.has_default_queryset_hooks():
+                break
+            auth_chained = not self.public_modes and (
+                view_controller.auth_lookup == '{}__{}'.format(
+                    view_controller.fk.name, view_parent.auth_lookup))
+            if not (self.has_acting_superuser or view_parent.public_modes or
+                    auth_chained):
+                break
+            if not view_parent.remember_object(
+                    obj.associate(view_controller=view_parent)):
+                break
+            view_controller = view_parent
+
+    def get_object_queryset(self):
+        queryset = super(ChainedObjectMixin, self).get_object_queryset()
+        try:
+            ancestor_query = self.get_ancestor_query()
+        except ValidationError:
+            return queryset.none()
+        if ancestor_query:
+            queryset = queryset.filter(**ancestor_query)
+        ancestor_lookup = self.get_ancestor_lookup()
+        if ancestor_lookup:
+            queryset = queryset.select_related(ancestor_lookup)
+        return queryset
+
+    def get_object(self, queryset=None):
+        obj = super(ChainedObjectMixin, self).get_object(queryset=queryset)
+        if queryset is None and obj is not None and self.get_ancestor_lookup():
+            self.share_ancestors(obj)
+        return obj
 
 
 class ViewChild(MultipleObjectMixin, BaseViewController):
@@ -93,7 +199,7 @@ class ViewChild(MultipleObjectMixin, BaseViewController):
         return permissions_model
 
 
-class ViewParent(MultipleObjectMixin, SingleObjectMixin, BaseViewController):
+class ViewParent(MultipleObjectMixin, ChainedObjectMixin, BaseViewController):
     """
     A View-Aware controller representing one of the parents in the chain of
     objects providing access to the current view.
@@ -109,12 +215,29 @@ class ViewParent(MultipleObjectMixin, SingleObjectMixin, BaseViewController):
         super(ViewParent, self).__init__(view=view, controller=controller)
         self.kwargs = kwargs
 
+    def has_default_queryset_hooks(self):
+        """
+        Returns whether neither this view parent nor its controller override
+        the hooks its queryset is built from, in which case objects fetched
+        along a child's FK are known to be within it.
+        """
+        from ...controllers import Controller
+        return all(
+            get_unbound_function(getattr(type(obj), name)) is
+            get_unbound_function(getattr(base, name))
+            for obj, base in ((self, ViewParent),
+                              (self.controller, Controller))
+            for name in QUERYSET_HOOKS)
+
 
 class ControllerViewMixin(BaseViewController):
 
     mode = None
     mode_title = ''
 
+    # when True, the queryset is constrained to the in-focus parent object
+    parent_constrained = False
+
     def __init__(self, controller, **kwargs):
         kwargs.setdefault('view', self)
         super(ControllerViewMixin, self).__init__(controller=controller,
@@ -143,6 +266,13 @@ class ControllerViewMixin(BaseViewController):
         return super(ControllerViewMixin, self).handle_common(
             handler, request, *args, **kwargs)
 
+    def get_queryset(self):
+        queryset = super(ControllerViewMixin, self).get_queryset()
+        if self.parent_constrained and self.view_parent:
+            queryset = queryset.filter(
+                **{self.fk.name: self.view_parent.get_object()})
+        return queryset
+
     @cached_property
     def view_children(self):
         """
@@ -14,6 +14,8 @@ class ListMixin(PaginationMixin, SearchMixin, MultipleObjectMixin,
                 ControllerViewMixin):
 
     mode = 'list'
+    # nested lists count and page the in-focus parent's children only
+    parent_constrained = True
 
     def handle_common(self, handler, request, *args, **kwargs):
 
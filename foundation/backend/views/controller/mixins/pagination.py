@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import json
+
 from django.contrib.admin.options import IncorrectLookupParameters
 from django.core.paginator import PageNotAnInteger, InvalidPage
+from django.db import DatabaseError, connections
+from django.utils.translation import ugettext as _
 
-from .variables import ALL_VAR, PAGE_VAR
+from .variables import ALL_VAR, CURSOR_VAR, PAGE_VAR
 
 __all__ = 'PaginationMixin',
 
@@ -13,17 +17,29 @@ class PaginationMixin(object):
     """ Pagination: execute on QS prior to Filtering... """
 
     def get_paginator(self, queryset, per_page, orphans=0, allow_empty_first_page=True):
-        return self.paginator_class(queryset, per_page, orphans, allow_empty_first_page)
+        # the controller option, since Django's list views define their own
+        paginator_class = self.controller.paginator_class
+        return paginator_class(queryset, per_page, orphans, allow_empty_first_page)
 
     def get_page_queryset(self, queryset, page):
 
-        return queryset.filter(pk__in=[obj.pk for obj in page])
+        return page.object_list
 
     def get_queryset(self):
 
+        # Django's ListView and the formset both ask for the queryset so only
+        # count and slice once per view
+        if '_paginated_queryset' in self.__dict__:
+            return self._paginated_queryset
+
         # auth-constrained queryset
         self.root_queryset = super(PaginationMixin, self).get_queryset()
 
+        # pages must be deterministic (and sliced querysets cannot be
+        # re-ordered by formsets later on)
+        if not self.root_queryset.ordered:
+            self.root_queryset = self.root_queryset.order_by('pk')
+
         # get the paginator but do not apply it yet
         self.paginator = self.get_paginator(
             self.root_queryset,
@@ -32,22 +48,37 @@ class PaginationMixin(object):
             allow_empty_first_page=False,
         )
 
-        # Get the number of objects, with controller filters applied.
-        self.result_count = self.paginator.count
+        if getattr(self.paginator, 'is_cursor', False):
+            queryset = self.get_cursor_queryset()
+            self._paginated_queryset = queryset
+            return queryset
 
-        # Get the total number of objects, with no admin filters applied.
-        self.full_result_count = (
-            self.root_queryset.count()
-            if self.show_full_result_count
-            else None
-        )
-        self.can_show_all = self.result_count <= self.list_max_show_all
+        # Get the number of objects, with controller filters applied.
+        self.result_count, self.result_count_is_exact = \
+            self.get_result_count(self.root_queryset)
+        if hasattr(self.paginator, 'set_count'):
+            self.paginator.set_count(self.result_count,
+                                     self.result_count_is_exact)
+
+        # Get the total number of objects, with no search applied, reusing the
+        # result count when nothing was filtered.
+        if not self.show_full_result_count:
+            self.full_result_count = None
+            self.full_result_count_is_exact = True
+        elif getattr(self, 'is_filtered', False):
+            self.full_result_count, self.full_result_count_is_exact = \
+                self.get_result_count(self.unfiltered_queryset)
+        else:
+            self.full_result_count = self.result_count
+            self.full_result_count_is_exact = self.result_count_is_exact
+        self.can_show_all = (self.result_count_is_exact and
+                             self.result_count <= self.list_max_show_all)
         self.multi_page = self.result_count > self.list_per_page
 
         # Get the list of objects to display on this page.
         if (self.show_all and self.can_show_all) or not self.multi_page:
             self.page = None
-            queryset = self.root_queryset._clone()
+            queryset = self.root_queryset
         else:
             try:
                 self.page = self.paginator.page(self.page_num)
@@ -56,13 +87,93 @@ class PaginationMixin(object):
             except InvalidPage:
                 raise IncorrectLookupParameters
 
-            # queryset = self.paginator.page(self.page_num).object_list
-            # TODO: not sure this is needed anymore... leftover?
             queryset = self.get_page_queryset(self.root_queryset, self.page)
 
-
+        self._paginated_queryset = queryset
         return queryset
 
+    def get_result_count(self, queryset):
+        """
+        Returns a (count, is_exact) tuple according to the count_strategy:
+        'exact' always counts, 'capped' counts at most count_cap + 1 rows and
+        'estimate' uses the database planner's estimate when it exceeds the
+        cap (falling back to a capped count where there is no estimate).
+        """
+        if self.count_strategy == 'exact':
+            return queryset.count(), True
+
+        cap = self.count_cap
+        if self.count_strategy == 'estimate':
+            estimate = self.get_estimated_count(queryset)
+            if estimate is not None and estimate > cap:
+                return estimate, False
+
+        count = queryset[:cap + 1].count()
+        return count, count <= cap
+
+    def get_estimated_count(self, queryset):
+        """
+        Returns the planner's row estimate for the queryset or None when the
+        database does not provide one (only PostgreSQL is supported).
+        """
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        sql, params = queryset.query.sql_with_params()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+                plan = cursor.fetchone()[0]
+        except DatabaseError:
+            return None
+        if not isinstance(plan, list):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    def format_count(self, count, is_exact):
+        """ Renders "N" for exact, "N+" for capped and "many" for estimates. """
+        if count is None:
+            return ''
+        if is_exact:
+            return '{}'.format(count)
+        if count == self.count_cap + 1:
+            return '{}+'.format(self.count_cap)
+        return _('many')
+
+    @property
+    def result_count_display(self):
+        return self.format_count(self.result_count,
+                                 self.result_count_is_exact)
+
+    @property
+    def full_result_count_display(self):
+        return self.format_count(self.full_result_count,
+                                 self.full_result_count_is_exact)
+
+    def get_cursor_queryset(self):
+        """
+        Keyset pagination: no OFFSET and, unless show_full_result_count, no
+        COUNT either.
+        """
+        try:
+            self.page = self.paginator.page(self.cursor)
+        except InvalidPage:
+            self.page = self.paginator.page(None)
+
+        if self.show_full_result_count:
+            self.result_count = self.paginator.count
+            self.full_result_count = (
+                self.unfiltered_queryset.count()
+                if getattr(self, 'is_filtered', False)
+                else self.result_count)
+        else:
+            self.result_count = self.full_result_count = None
+        self.result_count_is_exact = self.full_result_count_is_exact = True
+        self.can_show_all = False
+        self.multi_page = self.page.has_other_pages()
+
+        return self.get_page_queryset(self.root_queryset, self.page)
+
     def handle_common(self, handler, request, *args, **kwargs):
 
         """
@@ -82,8 +193,10 @@ class PaginationMixin(object):
         except ValueError:
             self.page_num = 1
         self.show_all = ALL_VAR in request.GET
+        self.cursor = request.GET.get(CURSOR_VAR)
 
-        if PAGE_VAR in self.params:
-            del self.params[PAGE_VAR]
+        for var in PAGE_VAR, CURSOR_VAR:
+            if var in self.params:
+                del self.params[var]
 
         return super(PaginationMixin, self).handle_common(handler, request, *args, **kwargs)
@@ -1,5 +1,6 @@
 ALL_VAR = 'all'
 PAGE_VAR = 'p'
+CURSOR_VAR = 'c'
 SEARCH_VAR = 'q'
 
 IGNORED_PARAMS = (
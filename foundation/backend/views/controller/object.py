@@ -4,16 +4,24 @@ from __future__ import unicode_literals
 from django.http.response import Http404
 from django.utils.translation import ugettext as _
 
-from ...controller import SingleObjectMixin
-from .base import ControllerViewMixin
+from .base import ChainedObjectMixin, ControllerViewMixin
 
 __all__ = 'ObjectMixin',
 
 
-class ObjectMixin(SingleObjectMixin, ControllerViewMixin):
+class ObjectMixin(ChainedObjectMixin, ControllerViewMixin):
 
     mode = 'object'
 
+    def get_object_cache_timeout(self):
+        """
+        Objects are only cached across requests for public display views,
+        whose object is the same for every user.
+        """
+        if self.mode == 'display' and self.mode in self.public_modes:
+            return self.object_cache_timeout or None
+        return None
+
     def get_object(self, queryset=None):
         """
         Returns the object the view is displaying.
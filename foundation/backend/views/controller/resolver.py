@@ -19,7 +19,7 @@ class ChainingMixin(ModelResolver):
         kwargs.update(**self.kwargs)
         kwargs = super(ChainingMixin, self).get_url_kwargs(mode, **kwargs)
 
-        if mode in ('list', 'add'):
+        if mode in ('list', 'add', 'autocomplete'):
             kwargs.pop(self.model_lookup, None)
 
         return kwargs
@@ -27,11 +27,8 @@ class ChainingMixin(ModelResolver):
     def get_url(self, mode, obj=None, route=None, **kwargs):
 
         # if obj passed to this call, add to kwargs, then ditch it
-        if obj and self.controller.model_lookup not in kwargs:
-            try:
-                lookup_value = getattr(obj, 'slug')
-            except AttributeError:
-                lookup_value = getattr(obj, 'pk')
-            kwargs.update({self.controller.model_lookup: lookup_value})
+        if obj and self.controller and self.controller.model_lookup not in kwargs:
+            kwargs.update({self.controller.model_lookup:
+                           self.controller.object_lookup.get_url_value(obj)})
 
         return super(ChainingMixin, self).get_url(mode, route=route, **kwargs)
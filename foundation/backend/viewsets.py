@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 from collections import OrderedDict
 
 from django.conf.urls import url
+from ..utils import get_composed_class
 from .views import ViewParent, ViewChild
 
 
@@ -17,6 +18,7 @@ class BackendViewSet(OrderedDict):
         self.route = route
         super(BackendViewSet, self).__init__(self.named_view_classes)
         mixins = self._get_view_class_mixins()
+        attrs = self._get_view_class_attrs()
         for mode in self:
             #if mode in router:
             #    raise KeyError(
@@ -24,13 +26,16 @@ class BackendViewSet(OrderedDict):
             #            mode, router))
             base_class = self[mode]
             view_name = self._get_view_class_name(base_class, mode, route)
-            view_class = type(view_name, tuple(mixins + [base_class]),
-                              {'__module__': __name__})
+            view_class = get_composed_class(
+                view_name, mixins + [base_class], attrs)
             self[mode] = self._get_view_as_callable(view_class, mode, route)
 
     def _get_view_class_name(self, view_class, mode, route):
         return view_class.__name__
 
+    def _get_view_class_attrs(self):
+        return {'__module__': __name__}
+
     def _get_view_class_mixins(self):
         mixins = [self.view_class_mixin] if self.view_class_mixin else []
         if self.router.backend.view_class_mixin:
@@ -86,11 +91,14 @@ class ControllerViewSet(BackendViewSet):
 
     def __init__(self, router, route):
         # need to ensure any view mixins are applied to partial view classes
-        super(ControllerViewSet, self).__init__(router, route)
+        # before the view classes are composed since they reference them
+        self.router = router
         mixins = self._get_view_class_mixins()
         for name in 'view_parent_class', 'view_child_class':
             klass = getattr(self, name)
-            setattr(self, name, type(klass.__name__, tuple(mixins + [klass]), {}))
+            setattr(self, name, get_composed_class(
+                klass.__name__, mixins + [klass], {'__module__': __name__}))
+        super(ControllerViewSet, self).__init__(router, route)
 
     def _get_view_class_name(self, *args, **kwargs):
         return str('{0}{1}'.format(
@@ -107,9 +115,12 @@ class ControllerViewSet(BackendViewSet):
                 mixins.append(mixin)
         return mixins
 
+    def _get_view_class_attrs(self):
+        attrs = super(ControllerViewSet, self)._get_view_class_attrs()
+        attrs.update(view_child_class=self.view_child_class,
+                     view_parent_class=self.view_parent_class)
+        return attrs
+
     def _get_view_as_callable(self, *args, **kwargs):
-        view = super(ControllerViewSet, self)._get_view_as_callable(
+        return super(ControllerViewSet, self)._get_view_as_callable(
             *args, controller=self.router.controller, **kwargs)
-        view.view_class.view_child_class = self.view_child_class
-        view.view_class.view_parent_class = self.view_parent_class
-        return view
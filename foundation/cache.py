@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.utils.encoding import force_bytes
+
+__all__ = ('get_model_version', 'bump_model_version', 'track_model_version',
+           'get_versioned_key')
+
+VERSION_KEY = 'foundation.version.{}'
+
+
+def get_model_version(model):
+    """
+    Returns the current version of a model's rows, which changes whenever
+    one is saved or deleted (once tracked by track_model_version).
+    """
+    key = VERSION_KEY.format(model._meta.label_lower)
+    version = cache.get(key)
+    if version is None:
+        # start from the clock (in microseconds, well ahead of any count of
+        # writes) so an evicted version is never reused
+        cache.add(key, int(time.time() * 1000000), None)
+        version = cache.get(key)
+    return version
+
+
+def bump_model_version(model):
+    """ Invalidates every key versioned by the model. """
+    key = VERSION_KEY.format(model._meta.label_lower)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, int(time.time() * 1000000), None)
+
+
+def _bump_sender_version(sender, **kwargs):
+    bump_model_version(sender)
+
+
+def track_model_version(model):
+    """ Bumps the model's version when one of its rows is saved or deleted. """
+    dispatch_uid = VERSION_KEY.format(model._meta.label_lower)
+    post_save.connect(_bump_sender_version, sender=model,
+                      dispatch_uid=dispatch_uid)
+    post_delete.connect(_bump_sender_version, sender=model,
+                        dispatch_uid=dispatch_uid)
+
+
+def get_versioned_key(prefix, model, *parts):
+    """
+    Returns a cache key for parts (e.g. an object lookup) that is abandoned
+    when the model's version changes.
+    """
+    digest = hashlib.md5(force_bytes(repr(parts))).hexdigest()
+    return '{}.{}.{}.{}'.format(
+        prefix, model._meta.label_lower, get_model_version(model), digest)
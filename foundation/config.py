@@ -1,8 +1,10 @@
 from django.apps import AppConfig
+from django.core import checks
 from django.db.models.signals import post_migrate
 from django.utils.translation import ugettext_lazy as _
 
 from .backend import get_backend
+from .backend.registry import check_controllers
 from .signals import create_permissions
 
 
@@ -20,6 +22,7 @@ class FoundationConfig(AppConfig):
     def ready(self):
         super(FoundationConfig, self).ready()
         self.module.config.autodiscover()
+        checks.register(check_controllers)
         backend = get_backend()
         if backend.create_permissions:
             post_migrate.connect(
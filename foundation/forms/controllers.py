@@ -18,6 +18,7 @@ class FormOptions(backend.controllers.PartialViewOptions):
     formfield_overrides = {}
     radio_fields = {}
     raw_id_fields = ()
+    autocomplete_fields = ()
     classes = None
 
     modelform_class = models.ModelForm
@@ -66,17 +67,16 @@ class FormInline(FormOptions, FormChild):
     def parent_model(self):
         return self.view.controller.model
 
-    def __getattribute__(self, name):
+    def __getattr__(self, name):
         """
         When a normal lookup fails, perform a secondary lookup in the model.
         """
-        super_getattr = super(FormInline, self).__getattribute__
-
         try:
-            return super_getattr(name)
+            return super(FormInline, self).__getattr__(name)
         except AttributeError as e:
-            model = super_getattr('model')
+            if name.startswith('__'):
+                raise
             try:
-                return getattr(model._meta, name)
+                return getattr(self.model._meta, name)
             except AttributeError:
                 raise e
@@ -2,13 +2,33 @@ from __future__ import unicode_literals
 
 from collections import OrderedDict
 from django.forms import forms
+from django.forms.widgets import Widget
 
 from .boundfield import ProxyField
 from .fieldsets import Fieldset
+from .widgets import AutocompleteSelect, ForeignKeyRawIdWidget, \
+    RelatedFieldWidgetWrapper
 
 __all__ = 'Form',
 
 
+def bind_field_widgets(field, view_controller):
+    """
+    Binds the view-aware widgets of a field, including those wrapped by
+    other widgets, to a view controller (or unbinds them for None).
+    """
+    view = view_controller.view if view_controller is not None else None
+    widget = field.widget
+    while isinstance(widget, Widget):
+        if isinstance(widget, (RelatedFieldWidgetWrapper, AutocompleteSelect)):
+            widget.set_related_controller(
+                view.get_related_controller(widget.rel.model)
+                if view is not None else None)
+        elif isinstance(widget, ForeignKeyRawIdWidget):
+            widget.view_controller = view_controller
+        widget = getattr(widget, 'widget', None)
+
+
 class BackendFormMixin(object):
     """
     Django's Base(Model)Form organizes Fields into a single Form.  Django Admin
@@ -38,6 +58,24 @@ class BackendFormMixin(object):
         if readonly_fields is None:
             readonly_fields = ()
         self.readonly_fields = readonly_fields
+        self.bind_widgets(view_controller)
+
+    def bind_widgets(self, view_controller):
+        """
+        Form classes are cached across requests, so rebind any view-aware
+        widgets on this instance's (copied) fields to the current view.
+        """
+        for field in self.fields.values():
+            bind_field_widgets(field, view_controller)
+
+    @classmethod
+    def unbind_widgets(cls):
+        """
+        Unbinds the view-aware widgets of the class's base fields so that a
+        class cached across requests keeps no view (or its request) alive.
+        """
+        for field in cls.base_fields.values():
+            bind_field_widgets(field, None)
 
     @property
     def empty_value_display(self):
@@ -68,7 +106,7 @@ class BackendFormMixin(object):
     @property
     def media(self):
         media = super(BackendFormMixin, self).media
-        for fs in self.fieldsets:
+        for fs in self.fieldsets.values():
             media = media + fs.media
         return media
 
@@ -3,10 +3,10 @@ from __future__ import unicode_literals
 
 import json
 
-from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.exceptions import ValidationError
 from django.db import router
-from django.db.models import ManyToOneRel
 from django.forms import models
+from django.forms.widgets import Select
 from django.forms.formsets import DELETION_FIELD_NAME, ORDERING_FIELD_NAME
 from django.template.defaultfilters import capfirst
 from django.urls import reverse
@@ -15,6 +15,7 @@ from django.utils.translation import ugettext
 
 from ..utils import label_for_field, help_text_for_field, quote, NestedObjects
 from .forms import BackendFormMixin
+from .widgets import AutocompleteSelect
 
 
 __all__ = ('ModelForm', 'FormSetModelForm', 'BaseModelFormSet',
@@ -123,13 +124,16 @@ class BackendFormSetMixin(object):
     """
 
     def __init__(self, view_controller, fieldsets, prepopulated_fields=None,
-                 readonly_fields=None, is_readonly=False, **kwargs):
+                 readonly_fields=None, is_readonly=False, object_list=None,
+                 **kwargs):
         """
         view is the BaseViewController subclass.  It could be a View,
         ViewParent, or ViewChild (for registered child or inline child).
+        object_list is the page of the queryset to show, when paginated.
         """
         super(BackendFormSetMixin, self).__init__(**kwargs)
         self.view_controller = view_controller
+        self.object_list = object_list
         self.fieldsets = fieldsets
         self.is_readonly = is_readonly
         if readonly_fields is None:
@@ -140,6 +144,13 @@ class BackendFormSetMixin(object):
         self.prepopulated_fields = prepopulated_fields
         self.classes = ' '.join(view_controller.classes) if view_controller.classes else ''
 
+    def get_queryset(self):
+        # a page is sliced from the queryset, so it cannot be filtered to the
+        # instance or re-ordered the way the unsliced queryset is
+        if self.object_list is not None:
+            return self.object_list
+        return super(BackendFormSetMixin, self).get_queryset()
+
     def get_form_kwargs(self, index):
         # satisfy extra kwargs needed by FieldsetForm
         kwargs = super(BackendFormSetMixin, self).get_form_kwargs(index)
@@ -149,6 +160,23 @@ class BackendFormSetMixin(object):
                       view_controller=self.view_controller)
         return kwargs
 
+    def _construct_form(self, i, **kwargs):
+        # the forms share their model choice fields' querysets, so evaluate
+        # each once per formset rather than once per rendered row
+        form = super(BackendFormSetMixin, self)._construct_form(i, **kwargs)
+        shared_choices = self.__dict__.setdefault('_shared_choices', {})
+        for name, field in form.fields.items():
+            # only selects render their choices; hidden pk fields do not
+            widget = getattr(field.widget, 'widget', field.widget)
+            if (not isinstance(field, models.ModelChoiceField)
+                    or not isinstance(widget, Select)
+                    or isinstance(widget, AutocompleteSelect)):
+                continue
+            if name not in shared_choices:
+                shared_choices[name] = list(field.choices)
+            field.choices = shared_choices[name]
+        return form
+
     def fields(self):
         for field_name in self.form.base_fields:
             if field_name in self.readonly_fields:
@@ -188,29 +216,6 @@ class BaseModelFormSet(BackendFormSetMixin, models.BaseModelFormSet):
     ADMIN SOURCE: ChangeList
     """
 
-    def apply_select_related(self, qs):
-        if self.list_select_related is True:
-            return qs.select_related()
-
-        if self.list_select_related is False:
-            if self.has_related_field_in_list_display():
-                return qs.select_related()
-
-        if self.list_select_related:
-            return qs.select_related(*self.list_select_related)
-        return qs
-
-    def has_related_field_in_list_display(self):
-        for field_name in self.list_display:
-            try:
-                field = self.view_controller.get_field(field_name)
-            except FieldDoesNotExist:
-                pass
-            else:
-                if isinstance(field.remote_field, ManyToOneRel):
-                    return True
-        return False
-
     def url_for_result(self, result):
         pk = getattr(result, self.pk_attname)
         return reverse('admin:%s_%s_change' % (self.view_controller.app_label,
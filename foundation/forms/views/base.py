@@ -3,12 +3,15 @@ from __future__ import unicode_literals
 
 import os
 
+from django.core.cache import cache
 from django.shortcuts import resolve_url
 from django.template.defaultfilters import title
-from django.utils.translation import ugettext_lazy as _
+from django.utils.encoding import force_text
+from django.utils.translation import get_language, ugettext_lazy as _
 from django.urls.exceptions import NoReverseMatch
 
 from ...backend import views
+from ...cache import get_model_version, get_versioned_key
 from .components import FormSetMixin
 from ...backend.views.controller.mixins import variables
 
@@ -117,6 +120,74 @@ class ControllerTemplateMixin(BreadcrumbMixin, views.ControllerViewMixin, views.
 
         return breadcrumbs
 
+    def get_fragment_cache_timeout(self, timeout=None):
+        """
+        Returns the seconds to cache fragments for (timeout, if given, in place
+        of fragment_cache_timeout), or None when fragments are rendered anew,
+        i.e. caching is disabled or the request may carry bound forms.
+        """
+        if not self.fragment_cache_timeout:
+            return None
+        if self.request.method not in ('GET', 'HEAD'):
+            return None
+        return timeout or self.fragment_cache_timeout
+
+    def get_fragment_permission_scope(self):
+        """
+        Returns what permission-dependent fragments vary on: the permitted
+        modes and, unless anonymous or an acting superuser, the user, whose
+        private queryset decides per-object permissions.
+        """
+        if self.has_acting_superuser:
+            user = 'superuser'
+        elif self.user.is_authenticated:
+            user = self.user.pk
+        else:
+            user = None
+        return sorted(self.permissions), user
+
+    def get_fragment_cache_key(self, fragment_name, vary_on=(), shared=False):
+        """
+        Returns the cache key of a fragment of this view.  It derives from the
+        controller, route, mode, URL kwargs, object pk, query string, language
+        and vary_on values, is abandoned when any of the controller's
+        fragment_models changes and, unless shared by every user of a public
+        mode, varies on the permission scope.
+        """
+        obj = getattr(self, 'object', None)
+        parts = [
+            fragment_name,
+            self.get_namespace(route=self.route),
+            self.mode,
+            sorted(self.kwargs.items()),
+            obj.pk if obj is not None else None,
+            sorted(self.request.GET.lists()),
+            get_language(),
+            [force_text(value) for value in vary_on],
+        ]
+        if not (shared and self.mode in self.public_modes):
+            parts.append(self.get_fragment_permission_scope())
+        parts.extend(get_model_version(model)
+                     for model in self.fragment_models[1:])
+        return get_versioned_key('foundation.fragment', self.model, *parts)
+
+    def get_cached_fragment(self, fragment_name, render, vary_on=(),
+                            shared=False, timeout=None):
+        """
+        Returns the cached content of a fragment, else the result of calling
+        render, which is cached for the fragment cache timeout.  This is the
+        programmatic equivalent of {% controllercache %}.
+        """
+        timeout = self.get_fragment_cache_timeout(timeout)
+        if not timeout:
+            return render()
+        key = self.get_fragment_cache_key(fragment_name, vary_on, shared)
+        content = cache.get(key)
+        if content is None:
+            content = render()
+            cache.set(key, content, timeout)
+        return content
+
     def get_context_data(self, **kwargs):
         kwargs.update({
             'view_controller': self,
@@ -9,21 +9,30 @@ from django.db import models
 from django.core.exceptions import FieldError
 from django.forms.utils import ErrorList
 from django.forms.widgets import CheckboxSelectMultiple, SelectMultiple
+from django.utils.six import get_unbound_function
 from django.utils.translation import string_concat, ugettext as _
 
 from django import forms
-from ....utils import flatten_fieldsets
+from ....utils import LRUCache, flatten_fieldsets, freeze, get_composed_class
 from ... import widgets
 
 __all__ = ('BaseModelFormMixin', 'HORIZONTAL',
-           'VERTICAL', 'FORMFIELD_FOR_DBFIELD_DEFAULTS')
+           'VERTICAL', 'FORMFIELD_FOR_DBFIELD_DEFAULTS', 'form_class_cache')
 
 
 HORIZONTAL, VERTICAL = 1, 2
 
+# generated form and formset classes, see get_form_class_cache_key
+form_class_cache = LRUCache(maxsize=256)
+
 FORMFIELD_FOR_DBFIELD_DEFAULTS = {
 }
 
+# hooks whose overrides may make generated fields depend on the request
+FORMFIELD_HOOKS = ('formfield_for_dbfield', 'formfield_for_choice_field',
+                   'formfield_for_foreignkey', 'formfield_for_manytomany',
+                   'get_field_queryset')
+
 def get_ul_class(radio_style):
     return 'radiolist' if radio_style == VERTICAL else 'radiolist inline'
 
@@ -103,6 +112,10 @@ class BaseModelFormMixin(object):
             ]
         return fieldsets
 
+    def get_related_field_names(self):
+        """ The fields of this view mode's fieldsets. """
+        return flatten_fieldsets(self.get_fieldsets(self.view.mode))
+
     def get_form_class_kwargs(self, modelform_class, obj=None, **kwargs):
         """
         Returns the (default) kwargs needed to generate the form(set) class via
@@ -122,7 +135,7 @@ class BaseModelFormMixin(object):
         # 2. the extra readonly_fields accumulated here and then excluded from
         #    form construction
         exclude = [] if self.exclude is None else list(self.exclude)
-        readonly_fields = list(self.get_readonly_fields(obj))
+        readonly_fields = list(self.get_readonly_fields(self.view.mode, obj))
 
         # had to put '__all__' in a list for it to pass through flatten...
         if len(fields) == 1 and fields[0] in (None, forms.ALL_FIELDS):
@@ -160,7 +173,9 @@ class BaseModelFormMixin(object):
             (f, None) for f in readonly_fields
             if f in modelform_class.declared_fields
         )
-        modelform_class = type(modelform_class.__name__, (modelform_class,), new_attrs)
+        new_attrs['__module__'] = modelform_class.__module__
+        modelform_class = get_composed_class(
+            modelform_class.__name__, (modelform_class,), new_attrs)
 
         # satisfy the modelform_factory
         defaults = {
@@ -184,15 +199,57 @@ class BaseModelFormMixin(object):
         form_class_kwargs = self.get_form_class_kwargs(
             modelform_class=modelform_class, obj=obj, **kwargs)
 
-        try:
-            ModelForm = forms.modelform_factory(self.model, **form_class_kwargs)
-        except FieldError as e:
-            raise FieldError(
-                '%s. Check fields/fieldsets/exclude attributes of class %s.'
-                % (e, self.__class__.__name__)
-            )
+        cache_key = self.get_form_class_cache_key('form', obj, form_class_kwargs)
+        ModelForm = form_class_cache.get(cache_key) if cache_key else None
+        if ModelForm is None:
+            try:
+                ModelForm = forms.modelform_factory(self.model, **form_class_kwargs)
+            except FieldError as e:
+                raise FieldError(
+                    '%s. Check fields/fieldsets/exclude attributes of class %s.'
+                    % (e, self.__class__.__name__)
+                )
+            if cache_key:
+                if hasattr(ModelForm, 'unbind_widgets'):
+                    ModelForm.unbind_widgets()
+                form_class_cache.set(cache_key, ModelForm)
         return ModelForm
 
+    def has_default_formfield_hooks(self):
+        """
+        Returns whether the formfield_for_* hooks are not overridden, in which
+        case the generated fields do not depend on the request or user.
+        """
+        cls = type(self)
+        return all(
+            get_unbound_function(getattr(cls, name)) is
+            get_unbound_function(getattr(BaseModelFormMixin, name))
+            for name in FORMFIELD_HOOKS)
+
+    def get_form_class_cache_key(self, kind, obj, class_kwargs):
+        """
+        Returns the key under which a generated form(set) class is cached or
+        None if it should not be cached.  Classes are shared across requests
+        so anything view-specific on their widgets is rebound when the form is
+        instantiated (see BackendFormMixin).  Classes built by overridden
+        formfield_for_* hooks or another formfield_callback are not cached,
+        as their fields may depend on the request or user.
+        """
+        class_kwargs = dict(class_kwargs)
+        callback = class_kwargs.pop('formfield_callback', None)
+        if callback is not None and getattr(callback, '__func__', None) is not \
+                get_unbound_function(BaseModelFormMixin.formfield_for_dbfield):
+            return None
+        if not self.has_default_formfield_hooks():
+            return None
+        key = (kind, type(self), self.controller, self.view.mode,
+               obj is not None, freeze(class_kwargs))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
     def get_form_kwargs(self):
         kwargs = super(BaseModelFormMixin, self).get_form_kwargs()
         obj = kwargs.get('instance')
@@ -337,6 +394,10 @@ class BaseModelFormMixin(object):
         db = kwargs.get('using')
         if db_field.name in self.raw_id_fields:
             kwargs['widget'] = widgets.ForeignKeyRawIdWidget(db_field.remote_field, self, using=db)
+        elif db_field.name in self.autocomplete_fields:
+            kwargs['widget'] = widgets.AutocompleteSelect(
+                db_field.remote_field,
+                self.view.get_related_controller(db_field.remote_field.model))
         elif db_field.name in self.radio_fields:
             kwargs['widget'] = widgets.RadioSelect(attrs={
                 'class': get_ul_class(self.radio_fields[db_field.name]),
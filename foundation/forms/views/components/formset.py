@@ -4,7 +4,7 @@ from __future__ import unicode_literals
 from django import forms
 
 #from ... import models
-from .form import BaseModelFormMixin
+from .form import BaseModelFormMixin, form_class_cache
 
 __all__ = 'FormSetMixin',
 
@@ -87,11 +87,18 @@ class FormSetMixin(BaseModelFormMixin):
                            else forms.modelformset_factory)
 
         formset_kwargs = self.get_formset_class_kwargs(obj=obj, **kwargs)
-        FormSet = formset_factory(**formset_kwargs)
+        cache_key = self.get_form_class_cache_key('formset', obj, formset_kwargs)
+        FormSet = form_class_cache.get(cache_key) if cache_key else None
+        if FormSet is None:
+            FormSet = formset_factory(**formset_kwargs)
+            if cache_key:
+                if hasattr(FormSet.form, 'unbind_widgets'):
+                    FormSet.form.unbind_widgets()
+                form_class_cache.set(cache_key, FormSet)
         return FormSet
 
     def get_formset_kwargs(self, formset_class, obj=None,
-                           queryset=None, **kwargs):
+                           queryset=None, object_list=None, **kwargs):
         # TODO: Not sure what this was doing for get_inline_formsets
         # if prefixes[prefix] != 1 or not prefix:
         #     prefix = "%s-%s" % (prefix, prefixes[prefix])
@@ -99,6 +106,7 @@ class FormSetMixin(BaseModelFormMixin):
             'prefix': formset_class.get_default_prefix(),
             # views normally groom the QS and pass it in but not inlines
             'queryset': queryset if queryset is not None else self.get_queryset(),
+            'object_list': object_list,
             'view_controller': self,
             # 'is_readonly': not self.view.edit,
             'fieldsets': list(self.get_fieldsets(mode=self.view.mode)),
@@ -116,7 +124,8 @@ class FormSetMixin(BaseModelFormMixin):
 
         return formset_params
 
-    def get_formset(self, obj=None, queryset=None, **kwargs):
+    def get_formset(self, obj=None, queryset=None, object_list=None,
+                    **kwargs):
         # SOURCE: get_changelist_formset
 
         # to avoid any excess "magic", we will assume this is the AUTHORITATIVE
@@ -127,8 +136,17 @@ class FormSetMixin(BaseModelFormMixin):
 
         FormSet = self.get_formset_class(obj=obj, **kwargs)
         formset_kwargs = self.get_formset_kwargs(
-            formset_class=FormSet, obj=obj, queryset=queryset, **kwargs)
-        return FormSet(**formset_kwargs)
+            formset_class=FormSet, obj=obj, queryset=queryset,
+            object_list=object_list, **kwargs)
+        self.formset = FormSet(**formset_kwargs)
+        return self.formset
+
+    def get_permission_candidates(self):
+        """ Objects of the formset are checked per row in templates. """
+        formset = self.__dict__.get('formset')
+        if formset is None:
+            return super(FormSetMixin, self).get_permission_candidates()
+        return [obj.pk for obj in formset.get_queryset()]
 
     def errors(self):
         return self.formset.errors
@@ -28,10 +28,12 @@ class ListView(FormSetMixin, ControllerTemplateMixin, ListMixin, list.ListView):
                       else None)
 
         # feed the par-reduced queryset to formset, which will in turn FK
-        # constrain it, as applicable
+        # constrain it, as applicable, and show only the paginated rows
+        object_list = self.get_queryset()
         self.formset = self.get_formset(
             obj=parent_obj,
-            queryset=self.queryset
+            queryset=self.root_queryset,
+            object_list=object_list,
         )
 
         return handler
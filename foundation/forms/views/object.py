@@ -85,7 +85,8 @@ class ProcessFormView(BaseModelFormMixin, ObjectMixin, ControllerTemplateMixin,
         else:
             form_validated = False
             new_object = self.form.instance
-        new_object._controller = self
+        if hasattr(new_object, 'associate'):
+            new_object.associate(view_controller=self)
         self.inline_formsets = self.get_inline_formsets(new_object)
 
         # val all formsets *first* to ensure we report them when form invalid
@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 from django.conf.urls import url
 
 from ..backend import ControllerViewSet
+from ..backend.views import AutocompleteView
 from . import views
 
 __all__ = 'PageViewSet', 'EmbedViewSet'
@@ -20,12 +21,14 @@ class BaseFormViewSet(ControllerViewSet):
         ('edit', views.EditView),
         ('delete', views.DeleteView),
         ('display', views.DisplayView),
+        ('autocomplete', AutocompleteView),
     )
 
-    list_names = ('list', 'add')
+    list_names = ('list', 'add', 'autocomplete')
 
     def get_urlpatterns(self):
         model_lookup = self.router.controller.model_lookup
+        pattern = self.router.controller.object_lookup.pattern
         urlpatterns = []
 
         # reserved modes list, add, and display need special treatment
@@ -41,8 +44,9 @@ class BaseFormViewSet(ControllerViewSet):
         # attach all single-object manipulation modes
         for mode in set(self) - set(('display',) + self.list_names):
             urlpatterns.append(url(
-                r'^(?P<{lookup}>[-\w]+)/{mode}$'.format(
+                r'^(?P<{lookup}>{pattern})/{mode}$'.format(
                     lookup=model_lookup,
+                    pattern=pattern,
                     mode=mode,
                 ),
                 self[mode],
@@ -52,7 +56,8 @@ class BaseFormViewSet(ControllerViewSet):
         # defer the display view until after "add" so it is not mistaken as slug
         if 'display' in self:
             urlpatterns.append(url(
-                r'^(?P<{lookup}>[-\w]+)$'.format(lookup=model_lookup),
+                r'^(?P<{lookup}>{pattern})$'.format(lookup=model_lookup,
+                                                   pattern=pattern),
                 self['display'],
                 name='display',
             ))
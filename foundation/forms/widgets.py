@@ -15,12 +15,13 @@ from django.utils import six
 from django.utils.encoding import force_text
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
+from django.utils.http import urlencode
 from django.utils.text import Truncator
 from django.utils.translation import ugettext as _
 
 __all__ = widgets.__all__ + (
-    'FilteredSelectMultiple', 'ForeignKeyRawIdWidget', 'ForeignKeyRawIdWidget',
-    'RelatedFieldWidgetWrapper'
+    'AutocompleteSelect', 'FilteredSelectMultiple', 'ForeignKeyRawIdWidget',
+    'ForeignKeyRawIdWidget', 'RelatedFieldWidgetWrapper'
 )
 del widgets
 
@@ -188,6 +189,64 @@ class ManyToManyRawIdWidget(ForeignKeyRawIdWidget):
             return value.split(',')
 
 
+class AutocompleteSelect(Select):
+    """
+    A Select rendering only the selected choice, whose other options are
+    loaded from the related controller's autocomplete view as the user types.
+    Renders every choice when the related controller has no autocomplete view.
+    """
+
+    url = None
+
+    class Media:
+        js = ('js/autocomplete.js',)
+
+    def __init__(self, rel, related_controller, attrs=None, choices=()):
+        self.rel = rel
+        self.related_controller = related_controller
+        super(AutocompleteSelect, self).__init__(attrs, choices)
+
+    def set_related_controller(self, related_controller):
+        self.related_controller = related_controller
+
+    def get_url(self):
+        from ..backend.views import TO_FIELD_VAR
+        url = (self.related_controller.get_url('autocomplete')
+               if self.related_controller
+               else None)
+        if url:
+            return '{}?{}'.format(url, urlencode({
+                TO_FIELD_VAR: self.rel.get_related_field().name}))
+        return None
+
+    def render(self, name, value, attrs=None):
+        self.url = self.get_url()
+        if self.url:
+            attrs = dict(attrs or {})
+            attrs['data-autocomplete-url'] = self.url
+            attrs['class'] = ' '.join(
+                filter(None, (attrs.get('class', self.attrs.get('class')),
+                              'autocomplete')))
+        return super(AutocompleteSelect, self).render(name, value, attrs)
+
+    def render_options(self, selected_choices):
+        field = getattr(self.choices, 'field', None)
+        if not self.url or field is None:
+            return super(AutocompleteSelect, self).render_options(selected_choices)
+
+        selected_choices = set(force_text(v) for v in selected_choices if v != '')
+        output = []
+        if field.empty_label is not None:
+            output.append(self.render_option(selected_choices, '', field.empty_label))
+        if selected_choices:
+            key = field.to_field_name or 'pk'
+            for obj in field.queryset.filter(**{key + '__in': selected_choices}):
+                output.append(self.render_option(
+                    selected_choices, field.prepare_value(obj),
+                    field.label_from_instance(obj)))
+        return '\n'.join(output)
+
+
 class RelatedFieldWidgetWrapper(Widget):
     """
     This class is a wrapper to a given widget to add the add icon for the
@@ -203,20 +262,10 @@ class RelatedFieldWidgetWrapper(Widget):
         self.widget = widget
         self.rel = rel
 
-        # related controller is either a ViewController subclass or a
-        # registered Controller
-        self.controller = (related_controller.controller
-                           if related_controller
-                           else None)
-        self.view_controller = (None
-                                if related_controller == self.controller
-                                else related_controller)
-
         # Backwards compatible check for whether a user can add related
         # objects.
-        if can_add_related is None:
-            can_add_related = self.view_controller is not None
         self.can_add_related = can_add_related
+        self.set_related_controller(related_controller)
         # XXX: The UX does not support multiple selected values.
         multiple = getattr(widget, 'allow_multiple_selected', False)
         self.can_change_related = not multiple and can_change_related
@@ -224,6 +273,31 @@ class RelatedFieldWidgetWrapper(Widget):
         cascade = getattr(rel, 'on_delete', None) is CASCADE
         self.can_delete_related = not multiple and not cascade and can_delete_related
 
+    def set_related_controller(self, related_controller):
+        """
+        Bind to the related controller, which is either a ViewController
+        subclass or a registered Controller.  Called again when a cached form
+        class is instantiated for another view.
+        """
+        self.controller = (related_controller.controller
+                           if related_controller
+                           else None)
+        self.view_controller = (None
+                                if related_controller == self.controller
+                                else related_controller)
+        if isinstance(self.widget, AutocompleteSelect):
+            self.widget.set_related_controller(related_controller)
+
+    @property
+    def can_add_related(self):
+        if self._can_add_related is None:
+            return self.view_controller is not None
+        return self._can_add_related
+
+    @can_add_related.setter
+    def can_add_related(self, value):
+        self._can_add_related = value
+
     def __deepcopy__(self, memo):
         obj = copy.copy(self)
         obj.widget = copy.deepcopy(self.widget, memo)
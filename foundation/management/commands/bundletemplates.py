@@ -0,0 +1,133 @@
+import io
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.template import engines
+from django.template.base import Template
+from django.template.exceptions import TemplateDoesNotExist
+from django.template.loader_tags import ExtendsNode, IncludeNode
+from django.utils import six
+from django.views.generic.base import TemplateResponseMixin
+from django.urls import get_resolver
+
+from ...backend import get_backend
+from ...template.bundle import write_bundle
+from ...template.engine import Engine
+from ...template.index import get_template_index
+from ...template.loader import select_template
+
+
+class Command(BaseCommand):
+    help = ("Resolves the templates of every registered controller's views, "
+            "then writes the app templates those views look up, and the ones "
+            "they extend or include by a constant name, to a bundle file for "
+            "foundation.template.loaders.bundle.Loader.  Templates looked up "
+            "by a name known only when rendering are left to the loaders "
+            "after it, unless named here.  Templates in the engine's DIRS "
+            "are not bundled.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='The bundle file to write.')
+        parser.add_argument(
+            'template_names', nargs='*',
+            help='Also bundle these template names, as looked up for every '
+                 'controller and without an app_label.')
+
+    def get_controllers(self, registrar):
+        for controller in registrar._registry.values():
+            yield controller
+            for child in self.get_controllers(controller):
+                yield child
+
+    def get_engine(self):
+        for backend in engines.all():
+            if isinstance(getattr(backend, 'engine', None), Engine):
+                return backend.engine
+        raise CommandError('No foundation template engine is configured.')
+
+    def add_lookup(self, lookups, template_name, app_label, model_name):
+        """
+        Records the lookup of a template name for the app_label and
+        model_name, along with the lookups of the templates its candidates
+        extend or include by a constant name (in the same scope).
+        """
+        lookup = app_label, model_name, template_name
+        if lookup in lookups:
+            return
+        lookups.add(lookup)
+        for path in self.index.get_paths(template_name, app_label=app_label,
+                                         model_name=model_name):
+            with io.open(path, encoding=settings.FILE_CHARSET) as fp:
+                template = Template(fp.read(), engine=self.engine)
+            nodes = (template.nodelist.get_nodes_by_type(ExtendsNode) +
+                     template.nodelist.get_nodes_by_type(IncludeNode))
+            for node in nodes:
+                name = getattr(node, 'parent_name', None) or node.template
+                if (isinstance(name.var, six.string_types)
+                        and not name.filters):
+                    self.add_lookup(lookups, name.var, app_label, model_name)
+
+    def resolve_views(self, controller, lookups):
+        """
+        Resolves each templated view's templates, recording their lookups,
+        and returns the count.
+        """
+        resolved = 0
+        scope = controller.app_label, controller.model_name
+        for route, viewset in getattr(controller, '_viewsets', {}).items():
+            for mode, view in viewset.items():
+                view_class = getattr(view, 'view_class', None)
+                if not (view_class and issubclass(view_class, TemplateResponseMixin)):
+                    continue
+                # as BackendTemplateMixin.get_template_names composes them
+                template_names = ['{}.html'.format(mode)]
+                if route:
+                    template_names.insert(0, '{}/{}'.format(route, template_names[0]))
+                try:
+                    select_template(template_names, app_label=scope[0],
+                                    model_name=scope[1])
+                except TemplateDoesNotExist:
+                    raise CommandError(
+                        'No template for the {} view of {} ({}).'.format(
+                            mode, controller.model._meta.label,
+                            ', '.join(template_names)))
+                for template_name in template_names:
+                    self.add_lookup(lookups, template_name, *scope)
+                resolved += 1
+        return resolved
+
+    def get_resolved_paths(self, lookups):
+        """
+        Yields each lookup with its candidate paths, in order.  The bundle
+        answers exactly these lookups, so any other scope (which may have
+        its own override) is left to the loaders after it.
+        """
+        for lookup in sorted(
+                lookups, key=lambda lookup: tuple(part or '' for part in lookup)):
+            app_label, model_name, template_name = lookup
+            yield lookup, self.index.get_paths(
+                template_name, app_label=app_label, model_name=model_name)
+
+    def handle(self, path, template_names=(), **options):
+        # the controllers' viewsets are composed with the urlpatterns
+        get_resolver().url_patterns
+
+        self.engine = self.get_engine()
+        self.index = get_template_index()
+        self.index.rebuild()
+
+        lookups = set()
+        controllers = list(self.get_controllers(get_backend()))
+        resolved = sum(self.resolve_views(controller, lookups)
+                       for controller in controllers)
+        for template_name in template_names or ():
+            self.add_lookup(lookups, template_name, None, None)
+            for controller in controllers:
+                self.add_lookup(lookups, template_name, controller.app_label,
+                                controller.model_name)
+
+        names, sources = write_bundle(path, self.get_resolved_paths(lookups),
+                                      encoding=settings.FILE_CHARSET)
+        self.stdout.write(
+            'Resolved {} view templates; bundled {} template names from {} '
+            'files into {}.'.format(resolved, names, sources, path))
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from ...template.index import get_template_index
+
+
+class Command(BaseCommand):
+    help = ("Lists the app template index: the candidate paths, in order, for "
+            "each template name per app_label and model_name.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'template_names', nargs='*',
+            help='Only show these template names.')
+        parser.add_argument(
+            '--app', dest='app_label',
+            help='Show the resolution order for this app_label.')
+        parser.add_argument(
+            '--model', dest='model_name',
+            help='Show the resolution order for this model_name (with --app).')
+
+    def handle(self, *args, **options):
+        index = get_template_index()
+        template_names = options['template_names']
+        app_label = options['app_label']
+
+        # resolve names as the loader would for the app_label/model_name
+        if app_label:
+            for template_name in template_names:
+                self.write_entry(
+                    (app_label, options['model_name'], template_name),
+                    index.get_paths(template_name, app_label=app_label,
+                                    model_name=options['model_name']))
+            return
+
+        for key, paths in index.items():
+            if not template_names or key[2] in template_names:
+                self.write_entry(key, paths)
+
+    def write_entry(self, key, paths):
+        app_label, model_name, template_name = key
+        scope = '.'.join(filter(None, (app_label, model_name)))
+        self.stdout.write('{}{}'.format(
+            template_name, ' [{}]'.format(scope) if scope else ''))
+        for path in paths:
+            self.stdout.write('    {}'.format(path))
+        if not paths:
+            self.stdout.write('    (not found)')
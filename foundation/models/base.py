@@ -5,19 +5,34 @@ from django.db import models
 
 from .exceptions import AssociativeAttributeError
 from .manager import Manager
+from .query import Association
 
 __all__ = 'Model',
 
 
 class AssociativeMixin(object):
 
+    @property
+    def _association(self):
+        """ The association of the queryset this instance was yielded by. """
+        ref = self.__dict__.get('_association_ref')
+        return ref() if ref is not None else None
+
+    def associate(self, controller=None, view_controller=None):
+        """ Associates this (e.g. unsaved) instance like its querysets do. """
+        self._association_ref = Association.get(
+            controller=controller or getattr(view_controller, 'controller', None),
+            view_controller=view_controller).ref
+        return self
+
     @property
     def view_controller(self):
-        if not self._view_controller:
+        association = self._association
+        if association is None or not association.view_controller:
             raise AssociativeAttributeError(
                 self.__class__.__name__, 'view_controller'
             )
-        return self._view_controller
+        return association.view_controller
 
     # Methods
     def get_model(self):
@@ -32,6 +47,14 @@ class Model(AssociativeMixin, models.Model):
 
     objects = Manager()
 
+    def __reduce__(self):
+        # the association is view state and weak references cannot be pickled
+        reconstructor, args, data = super(Model, self).__reduce__()
+        if '_association_ref' in data:
+            data = data.copy()
+            del data['_association_ref']
+        return reconstructor, args, data
+
     def save(self, force_insert=False, force_update=False, using=None,
              update_fields=None):
         if getattr(self, '_validate', True):
@@ -51,14 +74,9 @@ class Model(AssociativeMixin, models.Model):
 
     def has_permission(self, view_controller, mode):
 
-        # if no view-level permission, bail
-        has_permission = view_controller.has_permission(mode)
-
-        # otherwise, refer to the view controller's private (auth) queryset
-        if has_permission and mode not in view_controller.public_modes:
-            has_permission = self in view_controller.private_queryset
-
-        return has_permission
+        # view-level permission, then the view controller's private (auth)
+        # queryset unless the mode is public
+        return view_controller.has_object_permission(self, mode)
 
     class Meta:
         abstract = True
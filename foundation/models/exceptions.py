@@ -5,4 +5,4 @@ class AssociativeAttributeError(AttributeError):
             'most likely happened because a {class_name} instance method was '
             'called outside of a view context.'
         ).format(class_name=class_name, attr_name=attr_name)
-        super(AssociativeAttributeError, message)
+        super(AssociativeAttributeError, self).__init__(message)
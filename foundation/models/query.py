@@ -1,54 +1,90 @@
+import weakref
+
 from django.db.models import query
 
 from .exceptions import AssociativeAttributeError
 
-__all__ = 'QuerySet',
+__all__ = 'Association', 'QuerySet'
+
+
+class Association(object):
+    """
+    The controller and view controller a queryset (and the instances it
+    yields) is associated with.  One record is shared per controller or view
+    controller, which holds it, so instances only keep a weak reference.
+    """
+
+    __slots__ = 'controller', 'view_controller', 'ref', '__weakref__'
+
+    def __init__(self, controller=None, view_controller=None):
+        self.controller = controller
+        self.view_controller = view_controller
+        self.ref = weakref.ref(self)
+
+    @classmethod
+    def get(cls, controller=None, view_controller=None):
+        """ Returns the record shared by the view controller or controller. """
+        owner = view_controller or controller
+        association = owner.__dict__.get('_association')
+        if association is None:
+            association = owner.__dict__['_association'] = cls(
+                controller=controller, view_controller=view_controller)
+        return association
 
 
 class ModelIterable(query.ModelIterable):
     """
-    Iterable that yields a model instance for each row.
+    Iterable that yields a model instance for each row, referencing the
+    queryset's association.
     """
 
     def __iter__(self):
+        ref = self.queryset._association.ref
         for obj in super(ModelIterable, self).__iter__():
-            obj._controller = self.queryset._controller
-            obj._view_controller = self.queryset._view_controller
+            obj._association_ref = ref
             yield obj
 
 
 class AssociativeMixin(object):
 
-    _controller = None
-    _view_controller = None
-
-    def __init__(self, *args, **kwargs):
-        super(AssociativeMixin, self).__init__(*args, **kwargs)
-        self._iterable_class = ModelIterable
+    _association = None
 
     def _clone(self, **kwargs):
-        kwargs.update(_controller=self._controller,
-                      _view_controller=self._view_controller)
+        kwargs.setdefault('_association', self._association)
         return super(AssociativeMixin, self)._clone(**kwargs)
 
     def associate(self, **kwargs):
         view_controller = kwargs.get('view_controller')
-        vc_controller = getattr(view_controller, 'controller')
+        vc_controller = getattr(view_controller, 'controller', None)
         controller = kwargs.get('controller')
         if view_controller:
-            if self._view_controller and self.view_controller != view_controller:
+            if self._view_controller and self._view_controller != view_controller:
                 raise AttributeError('Ambiguous ViewController association.')
-            self._view_controller = view_controller
-        if vc_controller or controller:
-            if any((
-                vc_controller and controller and vc_controller != controller,
-                self._controller and controller and self._controller != controller,
-                self._controller and vc_controller and self._controller != vc_controller
-            )):
-                raise AttributeError('Ambiguous Controller association.')
-            self._controller = vc_controller or controller
+        else:
+            view_controller = self._view_controller
+        if any((
+            vc_controller and controller and vc_controller != controller,
+            self._controller and controller and self._controller != controller,
+            self._controller and vc_controller and self._controller != vc_controller
+        )):
+            raise AttributeError('Ambiguous Controller association.')
+        controller = vc_controller or controller or self._controller
+        if controller or view_controller:
+            self._association = Association.get(
+                controller=controller, view_controller=view_controller)
+            # only model instances reference the association
+            if self._iterable_class is query.ModelIterable:
+                self._iterable_class = ModelIterable
         return self
 
+    @property
+    def _controller(self):
+        return self._association.controller if self._association else None
+
+    @property
+    def _view_controller(self):
+        return self._association.view_controller if self._association else None
+
     @property
     def controller(self):
         if not self._controller:
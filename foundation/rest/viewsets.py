@@ -18,6 +18,7 @@ class APIViewSet(ControllerViewSet):
 
     def get_urlpatterns(self):
         model_lookup = self.router.controller.model_lookup
+        pattern = self.router.controller.object_lookup.pattern
         urlpatterns = []
 
         # reserved modes list, add, and display need special treatment
@@ -25,7 +26,8 @@ class APIViewSet(ControllerViewSet):
             urlpatterns.append(url(r'^$', self['list'], name='list'))
         if 'object' in self:
             urlpatterns.append(url(
-                r'^(?P<{lookup}>[-\w]+)$'.format(lookup=model_lookup),
+                r'^(?P<{lookup}>{pattern})$'.format(lookup=model_lookup,
+                                                   pattern=pattern),
                 self['object'],
                 name='object',
             ))
@@ -76,6 +76,10 @@ def create_permissions(app_config, verbosity=2, interactive=True, using=DEFAULT_
                         if content_type not in ctypes:
                             continue
                         view_mode = view_class.name or view_initkwargs['name']
+                        # views authorized by another mode get no permission
+                        if getattr(view_class, 'permission_mode',
+                                   view_mode) != view_mode:
+                            continue
                         verbose_name_plural = view_model._meta.verbose_name_plural
                     else:
                         # we cannot add perms on models not in the calling model's app
@@ -0,0 +1,65 @@
+/* Lazy-loading choices for select.autocomplete widgets.
+ * The select renders only its selected option; a search input is placed
+ * before it and, as the user types, the options are replaced with the JSON
+ * results of the related controller's autocomplete view (data-autocomplete-url).
+ */
+
+function loadAutocompleteOptions(select, term) {
+  let url = select.dataset.autocompleteUrl;
+  $.getJSON(url, {q: term}, function (data) {
+    let selected = select.value;
+    let keep = Array.prototype.filter.call(select.options, function (option) {
+      return option.value === '' || option.value === selected;
+    });
+    select.innerHTML = '';
+    keep.forEach(function (option) { select.appendChild(option); });
+    data.results.forEach(function (result) {
+      if (result.id === selected) return;
+      let option = document.createElement('option');
+      option.value = result.id;
+      option.textContent = result.text;
+      select.appendChild(option);
+    });
+    if (data.more) {
+      let option = document.createElement('option');
+      option.disabled = true;
+      option.textContent = '…';
+      select.appendChild(option);
+    }
+  });
+}
+
+function manageAutocomplete(select) {
+  if (select.dataset.autocompleteBound) return;
+  select.dataset.autocompleteBound = '1';
+
+  let input = document.createElement('input');
+  input.type = 'search';
+  input.className = 'form-control autocomplete-search';
+  input.setAttribute('autocomplete', 'off');
+  select.parentElement.insertBefore(input, select);
+
+  let timer = null;
+  let lastTerm = null;
+  function search() {
+    let term = input.value.trim();
+    if (term === lastTerm) return;
+    lastTerm = term;
+    loadAutocompleteOptions(select, term);
+  }
+  input.addEventListener('input', function () {
+    clearTimeout(timer);
+    timer = setTimeout(search, 250);
+  });
+  select.addEventListener('focus', search, {once: true});
+}
+
+function manageAutocompletes(root) {
+  Array.prototype.forEach.call(
+    (root || document).querySelectorAll('select.autocomplete[data-autocomplete-url]'),
+    manageAutocomplete
+  );
+}
+
+$(function () { manageAutocompletes(document); });
+$(document).ajaxComplete(function () { manageAutocompletes(document); });
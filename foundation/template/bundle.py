@@ -0,0 +1,78 @@
+import io
+import json
+import mmap
+import os
+import struct
+__all__ = 'write_bundle', 'TemplateBundle'
+
+MAGIC = b'FTB2'
+HEADER = struct.Struct('>4sI')  # magic and the length of the JSON table
+
+
+def write_bundle(path, lookups, encoding='utf-8'):
+    """
+    Writes the templates of resolved lookups, given as pairs of
+    ((app_label, model_name, template_name), paths), to a single file: the
+    lookups (with each source's offset and length) as JSON, followed by the
+    sources.  The file is written aside and renamed into place, so workers
+    never map a partial bundle.
+    """
+    data = io.BytesIO()
+    sources = {}
+    entries = []
+    for (app_label, model_name, template_name), paths in lookups:
+        entries.append([app_label, model_name, template_name, paths])
+        for source_path in paths:
+            if source_path not in sources:
+                with io.open(source_path, encoding=encoding) as fp:
+                    contents = fp.read().encode('utf-8')
+                sources[source_path] = [data.tell(), len(contents)]
+                data.write(contents)
+    table = json.dumps({'names': entries, 'sources': sources}).encode('utf-8')
+
+    temp_path = '{}.tmp'.format(path)
+    with open(temp_path, 'wb') as fp:
+        fp.write(HEADER.pack(MAGIC, len(table)))
+        fp.write(table)
+        fp.write(data.getvalue())
+    os.rename(temp_path, path)
+    return len(entries), len(sources)
+
+
+class TemplateBundle(object):
+    """
+    A bundle written by write_bundle, memory-mapped so that the sources are
+    only paged in (and shared between worker processes) as they are read.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as fp:
+            self.mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, table_length = HEADER.unpack(self.mmap[:HEADER.size])
+        if magic != MAGIC:
+            raise ValueError('{} is not a template bundle.'.format(path))
+        table = json.loads(
+            self.mmap[HEADER.size:HEADER.size + table_length].decode('utf-8'))
+        self.data_offset = HEADER.size + table_length
+        self.sources = table['sources']
+        self.lookups = {
+            (app_label, model_name, template_name): paths
+            for app_label, model_name, template_name, paths in table['names']
+        }
+
+    def get_paths(self, template_name, app_label=None, model_name=None):
+        """
+        Returns the paths resolved for exactly this lookup, or None if it was
+        not bundled (its candidates, e.g. a scoped override, are unknown).
+        """
+        return self.lookups.get((app_label, model_name, template_name))
+
+    def get_source(self, path):
+        """ Returns the source bundled for path, or None. """
+        try:
+            offset, length = self.sources[path]
+        except KeyError:
+            return None
+        start = self.data_offset + offset
+        return self.mmap[start:start + length].decode('utf-8')
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.template import engines
+
+from .engine import Engine
+
+
+def debug(request):
+    """
+    Adds "template_resolution", the live hit and miss counters of each
+    foundation engine's {% include %} resolution memo by backend alias, when
+    DEBUG is on and the request is from one of INTERNAL_IPS.
+    """
+    if not (settings.DEBUG and
+            request.META.get('REMOTE_ADDR') in settings.INTERNAL_IPS):
+        return {}
+    return {'template_resolution': {
+        backend.name: backend.engine.resolution_stats
+        for backend in engines.all()
+        if isinstance(getattr(backend, 'engine', None), Engine)
+    }}
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from django import template
 from django.template.base import Template
 from django.template.exceptions import TemplateDoesNotExist
@@ -5,6 +7,30 @@ from django.template.exceptions import TemplateDoesNotExist
 
 class Engine(template.Engine):
 
+    def __init__(self, dirs=None, app_dirs=False, debug=False, loaders=None,
+                 **kwargs):
+        """
+        Hard override defaults to the foundation loaders, cached unless
+        debugging, when no loaders are given.  Django's default loaders
+        cannot be used: they do not accept the app_label and model_name that
+        this engine passes when finding templates.  Configure "loaders" to
+        choose others.
+        """
+        if loaders is None:
+            loaders = ['foundation.template.loaders.filesystem.Loader']
+            if app_dirs:
+                loaders += ['foundation.template.loaders.app_directories.Loader']
+            if not debug:
+                loaders = [('foundation.template.loaders.cached.Loader', loaders)]
+            super(Engine, self).__init__(dirs=dirs, debug=debug,
+                                         loaders=loaders, **kwargs)
+            self.app_dirs = app_dirs
+        else:
+            super(Engine, self).__init__(dirs=dirs, app_dirs=app_dirs,
+                                         debug=debug, loaders=loaders, **kwargs)
+        # hits and misses of the per-render {% include %} resolution memo
+        self.resolution_stats = Counter(hits=0, misses=0)
+
     def find_template(self, name, dirs=None, skip=None, app_label=None,
                       model_name=None):
         """ Hard override accepts app_label and model_name """
@@ -0,0 +1,86 @@
+import os
+from collections import OrderedDict
+
+from django.apps import apps
+from django.utils._os import upath
+
+__all__ = 'TemplateIndex', 'get_template_index'
+
+
+class TemplateIndex(object):
+    """
+    An in-memory index of the templates in the installed apps' template
+    directories (scanned once, on first use), giving the ordered candidate
+    paths for a template name per app_label and model_name as
+    get_app_template_dirs would probe them:
+
+        <app>/templates/<app_label>/<model_name>/<name>  (the app_label's app)
+        <app>/templates/<app_label>/<name>               (the app_label's app)
+        <app>/templates/<name>                           (every app, in order)
+
+    Templates added after the scan are not found until rebuild() is called.
+    """
+
+    def __init__(self, dirname='templates', names=None):
+        self.dirname = dirname
+        self.names = names
+
+    def scan(self, template_dir):
+        """ Yields the template names (with "/" separators) under a dir. """
+        for root, dirs, files in os.walk(template_dir, followlinks=True):
+            dirs.sort()
+            relative_root = os.path.relpath(root, template_dir)
+            for filename in sorted(files):
+                name = os.path.normpath(os.path.join(relative_root, filename))
+                yield name.replace(os.sep, '/')
+
+    def rebuild(self):
+        names = OrderedDict()
+        for app_config in apps.get_app_configs():
+            if not app_config.path:
+                continue
+            template_dir = os.path.join(app_config.path, self.dirname)
+            if not os.path.isdir(template_dir):
+                continue
+            label = app_config.label
+            for name in self.scan(template_dir):
+                path = upath(os.path.join(template_dir, *name.split('/')))
+                names.setdefault((None, None, name), []).append(path)
+                # app (and model) specific templates of the app's own label
+                parts = name.split('/')
+                if len(parts) > 1 and parts[0] == label:
+                    names.setdefault(
+                        (label, None, '/'.join(parts[1:])), []).append(path)
+                    if len(parts) > 2:
+                        names.setdefault(
+                            (label, parts[1], '/'.join(parts[2:])), []
+                        ).append(path)
+        self.names = names
+
+    def get_paths(self, template_name, app_label=None, model_name=None):
+        """ Returns the ordered paths of existing candidates for the name. """
+        if self.names is None:
+            self.rebuild()
+        names = self.names
+        paths = []
+        if app_label:
+            if model_name:
+                paths.extend(
+                    names.get((app_label, model_name, template_name), ()))
+            paths.extend(names.get((app_label, None, template_name), ()))
+        paths.extend(names.get((None, None, template_name), ()))
+        return paths
+
+    def items(self):
+        """ Yields ((app_label, model_name, template_name), paths) entries. """
+        if self.names is None:
+            self.rebuild()
+        return self.names.items()
+
+
+_index = TemplateIndex()
+
+
+def get_template_index():
+    """ Returns the shared index of the installed apps' templates. """
+    return _index
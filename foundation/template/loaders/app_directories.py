@@ -1,10 +1,12 @@
 import os
 
 from django.apps import apps
+from django.template.base import Origin
 from django.template.loaders import app_directories
 from django.utils import lru_cache
 from django.utils._os import upath
 
+from ..index import get_template_index
 from .base import FoundationMixin
 
 
@@ -40,6 +42,29 @@ def get_app_template_dirs(dirname, app_label=None, model_name=None):
 
 
 class Loader(FoundationMixin, app_directories.Loader):
+    """
+    Finds templates from the TemplateIndex, unless debugging (when templates
+    may be added while running) or use_index is False, in which case each
+    candidate directory is probed:
+
+        ('foundation.template.loaders.app_directories.Loader', True)
+    """
+
+    def __init__(self, engine, use_index=None):
+        super(Loader, self).__init__(engine)
+        self.use_index = not engine.debug if use_index is None else use_index
+
+    def get_template_sources(self, template_name, template_dirs=None,
+                             app_label=None, model_name=None):
+        if template_dirs or not self.use_index:
+            for origin in super(Loader, self).get_template_sources(
+                    template_name, template_dirs, app_label, model_name):
+                yield origin
+            return
+        paths = get_template_index().get_paths(
+            template_name, app_label=app_label, model_name=model_name)
+        for path in paths:
+            yield Origin(name=path, template_name=template_name, loader=self)
 
     def get_dirs(self, app_label=None, model_name=None):
         """ Hard override accepts app_label and model_name """
@@ -0,0 +1,38 @@
+import os
+
+from django.template.base import Origin
+from django.template.exceptions import TemplateDoesNotExist
+from django.template.loaders import base
+
+from ..bundle import TemplateBundle
+from .base import FoundationMixin
+
+
+class Loader(FoundationMixin, base.Loader):
+    """
+    Loads app templates from a bundle built by the bundletemplates command,
+    without template discovery or disk reads.  Lookups the bundle did not
+    resolve (and all of them, without the bundle file) find no templates, so
+    the loaders after it are used:
+
+        ('foundation.template.loaders.bundle.Loader', '/path/to/templates.bundle')
+    """
+
+    def __init__(self, engine, path):
+        super(Loader, self).__init__(engine)
+        self.bundle = TemplateBundle(path) if os.path.exists(path) else None
+
+    def get_template_sources(self, template_name, template_dirs=None,
+                             app_label=None, model_name=None):
+        if self.bundle is None or template_dirs:
+            return
+        paths = self.bundle.get_paths(template_name, app_label=app_label,
+                                      model_name=model_name)
+        for path in paths or ():
+            yield Origin(name=path, template_name=template_name, loader=self)
+
+    def get_contents(self, origin):
+        contents = self.bundle.get_source(origin.name) if self.bundle else None
+        if contents is None:
+            raise TemplateDoesNotExist(origin)
+        return contents
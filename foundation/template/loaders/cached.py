@@ -0,0 +1,93 @@
+import os
+
+from django.template.backends.django import copy_exception
+from django.template.exceptions import TemplateDoesNotExist
+from django.template.loaders import cached
+from django.utils.inspect import func_supports_parameter
+
+from .base import FoundationMixin
+
+
+class Loader(FoundationMixin, cached.Loader):
+    """
+    Caches the templates of the wrapped loaders, including missing ones, per
+    template name, app_label, model_name and skipped origins.
+
+    With autoreload (only honoured when the engine is in debug), a template is
+    reloaded once its file is modified and missing templates are not cached:
+
+        ('foundation.template.loaders.cached.Loader', [...loaders...], True)
+    """
+
+    def __init__(self, engine, loaders, autoreload=False):
+        self.autoreload = autoreload and engine.debug
+        self.mtimes = {}
+        super(Loader, self).__init__(engine, loaders)
+
+    def get_template_sources(self, template_name, template_dirs=None,
+                             app_label=None, model_name=None):
+        """ Hard override passes app_label and model_name to the loaders """
+        for loader in self.loaders:
+            if func_supports_parameter(loader.get_template_sources, 'app_label'):
+                origins = loader.get_template_sources(
+                    template_name, template_dirs,
+                    app_label=app_label, model_name=model_name)
+            else:
+                origins = loader.get_template_sources(template_name, template_dirs)
+            for origin in origins:
+                yield origin
+
+    def cache_key(self, template_name, template_dirs, skip=None,
+                  app_label=None, model_name=None):
+        """ Hard override keys on app_label and model_name """
+        return (super(Loader, self).cache_key(template_name, template_dirs, skip),
+                app_label, model_name)
+
+    def get_mtime(self, origin):
+        try:
+            return os.path.getmtime(origin.name)
+        except (OSError, TypeError):
+            return None
+
+    def get_template(self, template_name, template_dirs=None, skip=None,
+                     app_label=None, model_name=None):
+        """
+        Returns the cached template (or raises the cached TemplateDoesNotExist)
+        for the key, loading and caching it on a miss.  See
+        django.template.loaders.cached.Loader.get_template.
+        Hard override accepts app_label and model_name
+        """
+        key = self.cache_key(template_name, template_dirs, skip,
+                             app_label, model_name)
+        hit = self.get_template_cache.get(key)
+        if hit and self.autoreload:
+            if self.get_mtime(hit.origin) != self.mtimes.get(key):
+                hit = None
+        if hit:
+            if isinstance(hit, type) and issubclass(hit, TemplateDoesNotExist):
+                raise hit(template_name)
+            elif isinstance(hit, TemplateDoesNotExist):
+                raise copy_exception(hit)
+            return hit
+
+        try:
+            template = super(Loader, self).get_template(
+                template_name, template_dirs, skip,
+                app_label=app_label, model_name=model_name,
+            )
+        except TemplateDoesNotExist as e:
+            if not self.autoreload:
+                self.get_template_cache[key] = (
+                    copy_exception(e) if self.engine.debug
+                    else TemplateDoesNotExist)
+            raise
+        else:
+            self.get_template_cache[key] = template
+            if self.autoreload:
+                self.mtimes[key] = self.get_mtime(template.origin)
+
+        return template
+
+    def reset(self):
+        super(Loader, self).reset()
+        self.mtimes.clear()
@@ -104,3 +104,75 @@ def mode_url(context, mode, obj=None, route=None):
     view_controller, obj = resolve_from_context(context, obj)
 
     return view_controller.get_url(mode, obj=obj, route=route)
+
+
+class ControllerCacheNode(Node):
+
+    def __init__(self, nodelist, fragment_name, vary_on, shared, timeout):
+        self.nodelist = nodelist
+        self.fragment_name = fragment_name
+        self.vary_on = vary_on
+        self.shared = shared
+        self.timeout = timeout
+
+    def __repr__(self):
+        return "<ControllerCacheNode: %s>" % self.fragment_name
+
+    def render(self, context):
+        view = context.get('view')
+        if not hasattr(view, 'get_cached_fragment'):
+            return self.nodelist.render(context)
+
+        timeout = None
+        if self.timeout is not None:
+            timeout = self.timeout.resolve(context)
+            try:
+                timeout = int(timeout) if timeout is not None else None
+            except (ValueError, TypeError):
+                raise TemplateSyntaxError(
+                    '"controllercache" timeout must be an integer: %r' % timeout)
+
+        return view.get_cached_fragment(
+            self.fragment_name,
+            lambda: self.nodelist.render(context),
+            vary_on=[var.resolve(context) for var in self.vary_on],
+            shared=self.shared,
+            timeout=timeout,
+        )
+
+
+@register.tag
+def controllercache(parser, token):
+    """
+    Caches the enclosed fragment of a controller view for the controller's
+    fragment_cache_timeout, keyed on the view's controller, mode, object and
+    query string and on the versions of the models it shows (so any save or
+    delete of them renders it anew):
+
+        {% controllercache fragment_name [shared] [timeout=<seconds>] [var ...] %}
+            ... controls, rows ...
+        {% endcontrollercache %}
+
+    Fragments vary on the user's permissions unless "shared" (only honoured
+    in public modes, e.g. for fragments without permission-dependent
+    controls).  Extra variables, e.g. a loop's form, are added to the key.
+    Fragments with a {% csrf_token %} must not be enclosed.
+    """
+    nodelist = parser.parse(('endcontrollercache',))
+    parser.delete_first_token()
+    bits = token.split_contents()
+    if len(bits) < 2:
+        raise TemplateSyntaxError(
+            "'%r' tag requires at least one argument." % bits[0])
+    fragment_name = bits[1]
+    shared = False
+    timeout = None
+    vary_on = []
+    for bit in bits[2:]:
+        if bit == 'shared':
+            shared = True
+        elif bit.startswith('timeout='):
+            timeout = parser.compile_filter(bit[len('timeout='):])
+        else:
+            vary_on.append(parser.compile_filter(bit))
+    return ControllerCacheNode(nodelist, fragment_name, vary_on, shared, timeout)
@@ -4,7 +4,7 @@ from django.template import Library
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 
-from ..backend.views.controller import ALL_VAR, PAGE_VAR, SEARCH_VAR
+from ..backend.views.controller import ALL_VAR, CURSOR_VAR, PAGE_VAR, SEARCH_VAR
 
 register = Library()
 
@@ -21,9 +21,13 @@ def paginator_number(view, i):
     elif i == view.page.number:
         return format_html('<li class="active"><a class="this-page" href="#">{} <span class="sr-only">(current)</span></a></li> ', i)
     else:
+        paginator = view.page.paginator
+        # a capped or estimated count does not know where the list ends
+        end = (getattr(paginator, 'count_is_exact', True) and
+               i == paginator.num_pages - 1)
         return format_html('<li><a href="{}"{}>{}</a></li> ',
                            view.get_query_string({PAGE_VAR: i}),
-                           mark_safe(' class="end"' if i == view.page.paginator.num_pages - 1 else ''),
+                           mark_safe(' class="end"' if end else ''),
                            i)
 
 
@@ -35,6 +39,28 @@ def pagination(view):
     paginator, page, page_num = view.paginator, None, 1
     previous_page = next_page = None
 
+    # keyset pagination only knows about the adjacent pages
+    if getattr(paginator, 'is_cursor', False):
+        page = view.page
+        pagination_required = page.has_other_pages()
+        page_range = []
+        if page.has_previous():
+            previous_page = view.get_query_string({CURSOR_VAR: page.previous_cursor})
+        if page.has_next():
+            next_page = view.get_query_string({CURSOR_VAR: page.next_cursor})
+        return {
+            'view': view,
+            'pagination_required': pagination_required,
+            'paginator': paginator,
+            'previous_page': previous_page,
+            'page': page,
+            'next_page': next_page,
+            'show_all_url': False,
+            'page_range': page_range,
+            'ALL_VAR': ALL_VAR,
+            '1': 1,
+        }
+
     # pagination_required = (not cl.show_all or not cl.can_show_all) and cl.multi_page
     pagination_required = paginator.num_pages > 1
     if not pagination_required:
@@ -44,9 +70,14 @@ def pagination(view):
         ON_EACH_SIDE = 3
         ON_ENDS = 2
 
+        # With a capped or estimated count only link the neighbouring pages.
         # If there are 10 or fewer pages, display links to every page.
         # Otherwise, do some fancy
-        if paginator.num_pages <= 10:
+        if not getattr(paginator, 'count_is_exact', True):
+            page_range = list(range(max(1, page_num - ON_EACH_SIDE), page_num + 1))
+            if page.has_next():
+                page_range.extend([page_num + 1, DOT])
+        elif paginator.num_pages <= 10:
             page_range = range(paginator.num_pages)
         else:
             # Insert "smart" pagination links, so that there are always ON_ENDS
@@ -65,9 +96,9 @@ def pagination(view):
                 page_range.extend(range(paginator.num_pages - ON_ENDS + 1, paginator.num_pages + 1))
             else:
                 page_range.extend(range(page_num, paginator.num_pages + 1))
-        if page_num > 1:
+        if page.has_previous():
             previous_page = view.get_query_string({PAGE_VAR: page_num - 1})
-        if page_num < paginator.num_pages:
+        if page.has_next():
             next_page = view.get_query_string({PAGE_VAR: page_num + 1})
 
     # need_show_all_link = cl.can_show_all and not cl.show_all and cl.multi_page
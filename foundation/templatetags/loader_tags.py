@@ -7,6 +7,36 @@ from django.utils import six
 logger = logging.getLogger('django.template')
 
 
+def get_template_scope(context, extra_context=None):
+    """
+    Returns the (app_label, model_name) templates are resolved for: those of
+    the extra context, else of its or the context's view_controller, else
+    the app_config's label.
+    """
+    extra_context = extra_context or {}
+
+    # extra context model_name and app_label have priority
+    model_name = extra_context.get('model_name')
+    app_label = extra_context.get('app_label')
+
+    # if either missing, try extra context view_controller,
+    # then view context view_controller
+    if not (model_name and app_label):
+        view_controller = extra_context.get(
+            'view_controller', context.get('view_controller'))
+        if view_controller:
+            model_name = model_name or getattr(view_controller, 'model_name', None)
+            app_label = app_label or getattr(view_controller, 'app_label', None)
+
+    # if still no app_label, check app_config
+    if not app_label:
+        app_config = extra_context.get('app_config', context.get('app_config'))
+        if app_config:
+            app_label = app_config.label
+
+    return app_label, model_name
+
+
 class ExtendsNode(loader_tags.ExtendsNode):
 
     def find_template(self, template_name, context):
@@ -18,16 +48,7 @@ class ExtendsNode(loader_tags.ExtendsNode):
         Make tag aware of contextual use of app_label and model_name
         """
 
-        # always start with view controller
-        view_controller = context.get('view_controller')
-        app_label = getattr(view_controller, 'app_label', None)
-        model_name = getattr(view_controller, 'model_name', None)
-
-        # then try app_config
-        if not app_label:
-            app_config = context.get('app_config')
-            if app_config:
-                app_label = app_config.label
+        app_label, model_name = get_template_scope(context)
 
         # RemovedInDjango20Warning: If any non-recursive loaders are installed
         # do a direct template lookup. If the same template name appears twice,
@@ -85,46 +106,25 @@ class IncludeNode(loader_tags.IncludeNode):
 
             # Does this quack like a Template?
             if not callable(getattr(template, 'render', None)):
-                # If not, we'll try our cache, and get_template()
+                # If not, we'll try our cache, and get_template(), keyed on
+                # the scope since rows may have other view controllers.
+                # Caching across renders is left to the cached loader.
                 template_name = template
+                app_label, model_name = get_template_scope(
+                    context, extra_context)
+                engine = context.template.engine
+                stats = getattr(engine, 'resolution_stats', None)
                 cache = context.render_context.setdefault(self.context_key, {})
-                template = cache.get(template_name)
+                key = template_name, app_label, model_name
+                template = cache.get(key)
                 if template is None:
-
-                    # extra context model_name and app_label have priority
-                    model_name = extra_context.get('model_name')
-                    app_label = extra_context.get('app_label')
-
-                    # if either missing, try extra context view_controller,
-                    # then view context view_controller
-                    if not (model_name and app_label):
-                        view_controller = extra_context.get(
-                            'view_controller',
-                            context.get('view_controller')
-                        )
-                        if view_controller:
-                            model_name = model_name or view_controller.model_name
-                            app_label = app_label or view_controller.app_label
-
-                    # if still no app_label, check app_config
-                    if not app_label:
-                        app_config = extra_context.get(
-                            'app_config',
-                            context.get('app_config')
-                        )
-                        if app_config:
-                            app_label = app_config.label
-
-                    # by now we do (not) have app_label (and model_name)
-                    template = (
-                        context.template.engine.get_template(
-                            template_name,
-                            app_label=app_label,
-                            model_name=model_name)
-                        if app_label or model_name
-                        else context.template.engine.get_template(template_name)
-                    )
-                    cache[template_name] = template
+                    template = cache[key] = engine.get_template(
+                        template_name, app_label=app_label,
+                        model_name=model_name)
+                    if stats is not None:
+                        stats['misses'] += 1
+                elif stats is not None:
+                    stats['hits'] += 1
             if self.isolated_context:
                 return template.render(context.new(extra_context))
             with context.push(**extra_context):
@@ -2,7 +2,8 @@ from __future__ import unicode_literals
 
 import datetime
 import decimal
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
 
 from django.apps import apps
 from django.conf import settings
@@ -24,6 +25,84 @@ from django.urls.exceptions import NoReverseMatch
 from django.db.models.fields.reverse_related import OneToOneRel
 
 
+# process-wide cache of classes composed at runtime, see get_composed_class
+_composed_classes = {}
+
+
+def get_composed_class(name, bases, attrs=None):
+    """
+    Returns a class built with type(name, bases, attrs), creating it only once
+    per distinct (name, bases, attrs) so identical compositions share a single
+    class object.  Compositions with unhashable attribute values (e.g. lists)
+    cannot be keyed, so a new class is built for each of those.
+    """
+    attrs = dict(attrs or {})
+    try:
+        key = (str(name), tuple(bases), frozenset(attrs.items()))
+        hash(key)
+    except TypeError:
+        return type(str(name), tuple(bases), attrs)
+    try:
+        return _composed_classes[key]
+    except KeyError:
+        klass = type(str(name), tuple(bases), attrs)
+        # setdefault so that concurrent composition still yields one class
+        return _composed_classes.setdefault(key, klass)
+
+
+class LRUCache(object):
+    """
+    A small thread-safe mapping that keeps at most maxsize entries, evicting
+    the least recently used entry first.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data.pop(key)
+            except KeyError:
+                return default
+            self._data[key] = value
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+def freeze(value):
+    """
+    Returns a hashable equivalent of value, converting lists to tuples and
+    dicts/sets to frozensets (recursively).
+    """
+    if isinstance(value, dict):
+        return frozenset((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, set):
+        return frozenset(freeze(v) for v in value)
+    return value
+
+
 def redirect_to_url(request, url, redirect_field_name=REDIRECT_FIELD_NAME):
     """
     Redirects the requester to url, passing the requested URL as 'next'.
@@ -76,8 +155,8 @@ def get_eligible_models(app_config):
 
 
 def get_project_app_configs():
-    for project_app in settings.INSTALLED_APPS:
-        app_config = apps.get_app_config(project_app.split('.')[-1])
+    # app configs are in INSTALLED_APPS order, which may name AppConfig paths
+    for app_config in apps.get_app_configs():
         if list(get_eligible_models(app_config)):
             yield app_config
 
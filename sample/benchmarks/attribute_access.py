@@ -0,0 +1,61 @@
+"""
+Times attribute access on a sample view, its controller and the model _meta
+they fall back to (see BaseController.__getattr__):
+
+    $ cd sample
+    $ python benchmarks/attribute_access.py
+"""
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+import django
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sample.settings')
+
+NUMBER = 200000
+REPEAT = 5
+
+STATEMENTS = (
+    ('own attribute (view.mode)', 'view.mode'),
+    ('controller attribute (view.list_per_page)', 'view.list_per_page'),
+    ('model _meta via view (view.verbose_name)', 'view.verbose_name'),
+    ('model _meta via controller', 'controller.verbose_name'),
+)
+
+
+def get_list_view():
+    from django.contrib.auth.models import AnonymousUser
+    from django.test import RequestFactory
+    from foundation.backend import get_backend
+    from blogs.models import Blog
+
+    backend = get_backend()
+    backend.urls
+    controller = backend.get_registered_controller(Blog)
+    view_func = controller._viewsets[None]['list']
+    view = view_func.view_class(**view_func.view_initkwargs)
+    view.request = RequestFactory().get('/')
+    view.request.user = AnonymousUser()
+    view.kwargs = {}
+    return controller, view
+
+
+def main():
+    django.setup()
+    # timeit's globals argument is Python 3 only, so the statements import
+    # the objects from this module's globals instead
+    global controller, view
+    controller, view = get_list_view()
+    setup = 'from {} import controller, view'.format(__name__)
+    for label, statement in STATEMENTS:
+        timer = timeit.Timer(statement, setup)
+        best = min(timer.repeat(number=NUMBER, repeat=REPEAT))
+        print('{:<45} {:>6.0f} ns'.format(label, best / NUMBER * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -24,7 +24,7 @@ class FormViewMixin(object):
         return formfield
 
 
-class APIFormController(forms.FormController):
+class APIFormController(forms.PageController):
 
     viewsets = {
         None: forms.PageViewSet,
@@ -73,8 +73,11 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # cached, reloading templates that change while DEBUG is on
             'loaders': [
-                'foundation.template.loaders.app_directories.Loader',
+                ('foundation.template.loaders.cached.Loader', [
+                    'foundation.template.loaders.app_directories.Loader',
+                ], True),
             ],
         },
     },
@@ -0,0 +1 @@
+default_app_config = 'backend_views.apps.BackendViewsConfig'
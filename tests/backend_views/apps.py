@@ -0,0 +1,13 @@
+from foundation.backend import AppConfig, Backend
+
+
+class TestBackend(Backend):
+    """ The default backend of the tests (see FOUNDATION_BACKEND). """
+
+    routes = ('embed',)
+
+
+class BackendViewsConfig(AppConfig):
+
+    name = 'backend_views'
+    import_urls = False
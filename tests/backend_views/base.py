@@ -0,0 +1,34 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from .models import Blog, Post
+
+TEMPLATES = [{
+    'BACKEND': 'foundation.template.backends.django.DjangoTemplates',
+    'APP_DIRS': True,
+    'OPTIONS': {
+        'debug': True,
+        'context_processors': [
+            'django.template.context_processors.request',
+            'django.contrib.auth.context_processors.auth',
+            'django.contrib.messages.context_processors.messages',
+        ],
+    },
+}]
+
+
+@override_settings(ROOT_URLCONF='backend_views.urls', TEMPLATES=TEMPLATES)
+class BackendTestCase(TestCase):
+    """ Serves the backend_views controllers with the foundation templates. """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user('joe', password='secret')
+        cls.blog = Blog.objects.create(owner=cls.owner, slug='red', title='Red')
+        cls.post = Post.objects.create(
+            blog=cls.blog, slug='first', title='First', body='First body')
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
@@ -0,0 +1,22 @@
+from foundation import forms
+from foundation.backend import register
+
+from . import models
+
+
+class PostController(forms.EmbedController):
+
+    model = models.Post
+    public_modes = ('list', 'display')
+    fields = ('blog', 'title', 'body')
+    search_fields = ('title',)
+
+
+@register(models.Blog)
+class BlogController(forms.EmbedController):
+
+    fk_name = 'owner'
+    public_modes = ('list', 'display')
+    fields = ('title',)
+    search_fields = ('title',)
+    children = [PostController]
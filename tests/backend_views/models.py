@@ -0,0 +1,37 @@
+import uuid
+
+from django.conf import settings
+
+from foundation import models
+
+
+class Blog(models.Model):
+    owner = models.ForeignKey(settings.AUTH_USER_MODEL, related_name='blogs')
+    slug = models.SlugField(max_length=25, unique=True)
+    title = models.CharField(max_length=200)
+
+    def __str__(self):
+        return self.title
+
+
+class Post(models.Model):
+    blog = models.ForeignKey(Blog, related_name='blog_entries')
+    slug = models.SlugField(max_length=50, unique=True)
+    title = models.CharField(max_length=200)
+    body = models.TextField()
+    rating = models.IntegerField(default=0)
+    published = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return self.title
+
+    class Meta:
+        ordering = ['pk']
+
+
+class Tag(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    name = models.CharField(max_length=50)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,7 @@
+from django.conf.urls import include, url
+
+from foundation.backend import get_backend
+
+urlpatterns = [
+    url(r'^portal/', include(list(get_backend().urls))),
+]
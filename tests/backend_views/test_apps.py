@@ -0,0 +1,73 @@
+from django.apps import apps
+from django.test import SimpleTestCase, override_settings
+
+from foundation.backend import Backend, Controller, get_backend
+from foundation.backend.base import logger
+
+from .apps import TestBackend
+from .base import BackendTestCase
+from .models import Tag
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class AppIndexTests(BackendTestCase):
+
+    def setUp(self):
+        super(AppIndexTests, self).setUp()
+        self.backend = get_backend()
+        self.backend._app_index = None
+        self.addCleanup(setattr, self.backend, '_app_index', None)
+        self.app_config = apps.get_app_config('backend_views')
+
+    def test_app_index(self):
+        self.assertIn((self.app_config, '/backend_views/'),
+                      self.backend.app_index)
+
+    @override_settings(ROOT_URLCONF='backend_views.prefixed_urls')
+    def test_app_index_under_prefix(self):
+        self.assertIn((self.app_config, '/portal/backend_views/'),
+                      self.backend.app_index)
+        response = self.client.get('/portal/backend_views/blogs/')
+        self.assertContains(response, 'href="/portal/backend_views/"')
+
+    def test_invalidate_urls_drops_app_index(self):
+        app_index = self.backend.app_index
+        self.backend.invalidate_urls()
+        self.assertIsNone(self.backend._app_index)
+        self.assertEqual(self.backend.app_index, app_index)
+
+    def test_default_backend_is_made_from_the_setting(self):
+        self.assertIsInstance(self.backend, TestBackend)
+
+
+class TagController(Controller):
+
+    model = Tag
+
+
+class BackendURLsTests(SimpleTestCase):
+
+    def setUp(self):
+        self.backend = Backend()
+
+    def test_urls_are_built_once(self):
+        urls = self.backend.urls
+        self.assertIs(self.backend.urls, urls)
+        self.assertEqual(self.backend.urls_build_count, 1)
+
+    @mock.patch.object(logger, 'warning')
+    def test_registration_rebuilds_the_urls(self, warning):
+        urls = self.backend.urls
+        self.backend.register(Tag, TagController)
+        self.assertIsNone(self.backend._urls)
+        self.assertIsNot(self.backend.urls, urls)
+        self.assertEqual(self.backend.urls_build_count, 2)
+        self.backend.unregister(Tag)
+        self.backend.urls
+        self.assertEqual(self.backend.urls_build_count, 3)
+        # rebuilds are logged as a warning
+        self.assertEqual(warning.call_count, 2)
@@ -0,0 +1,77 @@
+import json
+
+from django.apps import apps
+from django.contrib.auth.models import Permission
+from django.contrib.contenttypes.models import ContentType
+from django.utils.six import StringIO
+
+from foundation.backend import get_backend
+from foundation.signals import create_permissions
+
+from .base import BackendTestCase
+from .controllers import BlogController
+from .models import Blog, Post
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class AutocompleteTests(BackendTestCase):
+
+    url = '/backend_views/blogs/autocomplete'
+
+    def get_results(self, url=None, **params):
+        response = self.client.get(url or self.url, params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content.decode('utf-8'))['results']
+
+    def test_matches_by_prefix(self):
+        Blog.objects.create(owner=self.owner, slug='blue', title='Blue')
+        self.assertEqual(self.get_results(q='re'),
+                         [{'id': str(self.blog.pk), 'text': 'Red'}])
+
+    def test_nested_results_are_constrained_to_the_parent(self):
+        other = Blog.objects.create(owner=self.owner, slug='blue', title='Blue')
+        Post.objects.create(blog=other, slug='fourth', title='Fourth',
+                            body='Body')
+        results = self.get_results('/backend_views/blogs/red/posts/autocomplete',
+                                   q='f')
+        self.assertEqual(results, [{'id': str(self.post.pk), 'text': 'First'}])
+
+    def test_pk_is_the_default_to_field(self):
+        self.assertEqual(self.get_results(q='red', _to_field='id'),
+                         self.get_results(q='red'))
+
+    def test_unreferenced_to_field_is_rejected(self):
+        # the slug is unique but no relation refers to it
+        response = self.client.get(self.url, {'q': 'red', '_to_field': 'slug'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_requires_list_permission(self):
+        with mock.patch.object(BlogController, 'public_modes', ()):
+            response = self.client.get(self.url, {'q': 'red'})
+        self.assertEqual(response.status_code, 302)
+
+    def test_is_not_a_mode_of_its_own(self):
+        controller = get_backend().get_registered_controller(Blog)
+        self.assertIn('list', controller.all_modes)
+        self.assertNotIn('autocomplete', controller.all_modes)
+
+    def test_is_given_no_permission(self):
+        with mock.patch('sys.stdout', new_callable=StringIO):
+            create_permissions(apps.get_app_config('backend_views'),
+                               verbosity=0)
+        codenames = set(Permission.objects.filter(
+            content_type=ContentType.objects.get_for_model(Blog),
+        ).values_list('codename', flat=True))
+        modes = {codename.rsplit(':', 1)[-1] for codename in codenames}
+        self.assertIn('list', modes)
+        self.assertNotIn('autocomplete', modes)
+
+    def test_cached_results_follow_model_changes(self):
+        self.assertEqual(self.get_results(q='r')[0]['text'], 'Red')
+        self.blog.title = 'Rose'
+        self.blog.save()
+        self.assertEqual(self.get_results(q='r')[0]['text'], 'Rose')
@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+
+from django.core.management import call_command
+from django.template import Context
+from django.test import SimpleTestCase, override_settings
+from django.utils.six import StringIO
+
+from foundation.template.bundle import TemplateBundle, write_bundle
+from foundation.template.engine import Engine
+from foundation.template.index import get_template_index
+
+from .base import TEMPLATES
+
+
+@override_settings(ROOT_URLCONF='backend_views.urls', TEMPLATES=TEMPLATES)
+class BundleTemplatesTests(SimpleTestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, 'templates.bundle')
+
+    def get_bundle(self, *template_names):
+        call_command('bundletemplates', self.path, *template_names,
+                     stdout=StringIO())
+        return TemplateBundle(self.path)
+
+    def test_bundles_the_resolved_view_templates(self):
+        bundle = self.get_bundle()
+        names = {key[2] for key in bundle.lookups}
+        # the default route's names are unprefixed; embed's are prefixed
+        self.assertIn('list.html', names)
+        self.assertIn('embed/list.html', names)
+        self.assertNotIn('None/list.html', names)
+        # along with the templates they extend
+        self.assertIn('base.html', names)
+        # but not the rest of the app templates
+        self.assertNotIn('admin/login.html', names)
+        paths = bundle.get_paths('list.html', app_label='backend_views',
+                                 model_name='post')
+        self.assertTrue(paths)
+        self.assertIsNotNone(bundle.get_source(paths[0]))
+
+    def test_bundles_named_templates(self):
+        bundle = self.get_bundle('admin/login.html')
+        self.assertTrue(bundle.get_paths('admin/login.html'))
+
+    def test_unrecorded_scopes_are_left_to_later_loaders(self):
+        # only the unscoped lookup is bundled, so the post's own override
+        # must still be found by the app_directories loader
+        write_bundle(self.path, [
+            ((None, None, 'bundled.html'),
+             get_template_index().get_paths('bundled.html')),
+        ])
+        engine = Engine(loaders=[
+            ('foundation.template.loaders.bundle.Loader', self.path),
+            'foundation.template.loaders.app_directories.Loader',
+        ])
+        template = engine.get_template('bundled.html')
+        self.assertEqual(template.origin.loader_name,
+                         'foundation.template.loaders.bundle.Loader')
+        self.assertEqual(template.render(Context()).strip(), 'generic')
+        template = engine.get_template(
+            'bundled.html', app_label='backend_views', model_name='post')
+        self.assertEqual(template.render(Context()).strip(), 'post override')
@@ -0,0 +1,72 @@
+from foundation.cache import track_model_version
+
+from .base import BackendTestCase
+from .controllers import BlogController, PostController
+from .models import Blog, Post
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class EmbedTemplateTests(BackendTestCase):
+
+    def render(self, url, template_name):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(template_name,
+                      [template.name for template in response.templates])
+        return response.content.decode('utf-8')
+
+    def test_list(self):
+        self.assertIn('Red', self.render('/embed/backend_views/blogs/',
+                                         'embed/list.html'))
+
+    def test_object(self):
+        self.assertIn('Red', self.render('/embed/backend_views/blogs/red',
+                                         'embed/object.html'))
+
+
+@mock.patch.object(BlogController, 'fragment_cache_timeout', 60)
+@mock.patch.object(PostController, 'fragment_cache_timeout', 60)
+class EmbedFragmentCacheTests(BackendTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super(EmbedFragmentCacheTests, cls).setUpClass()
+        track_model_version(Blog)
+        track_model_version(Post)
+
+    def render(self, url):
+        return self.client.get(url).content.decode('utf-8')
+
+    def test_object_fragment_is_cached_until_the_object_changes(self):
+        url = '/embed/backend_views/blogs/red'
+        self.assertIn('Red', self.render(url))
+        # an update without signals leaves the cached fragment in place
+        Blog.objects.filter(pk=self.blog.pk).update(title='Crimson')
+        self.assertIn('Red', self.render(url))
+        self.blog.title = 'Scarlet'
+        self.blog.save()
+        content = self.render(url)
+        self.assertIn('Scarlet', content)
+        self.assertNotIn('Red', content)
+
+    def test_list_fragment_follows_new_rows(self):
+        url = '/embed/backend_views/blogs/'
+        self.assertNotIn('Blue', self.render(url))
+        Blog.objects.create(owner=self.owner, slug='blue', title='Blue')
+        self.assertIn('Blue', self.render(url))
+
+    def test_fragment_key_follows_the_parent(self):
+        url = '/embed/backend_views/blogs/red/posts/'
+
+        def get_key():
+            view = self.client.get(url).context['view']
+            return view.get_fragment_cache_key('content-body')
+
+        key = get_key()
+        self.assertEqual(get_key(), key)
+        self.blog.save()
+        self.assertNotEqual(get_key(), key)
@@ -0,0 +1,63 @@
+from foundation.forms.forms import BackendFormMixin
+from foundation.forms.views.components.form import form_class_cache
+from foundation.forms.widgets import (
+    AutocompleteSelect, ForeignKeyRawIdWidget, RelatedFieldWidgetWrapper)
+
+from .base import BackendTestCase
+
+
+def get_cached_form_classes():
+    for cls in form_class_cache._data.values():
+        form_class = getattr(cls, 'form', cls)
+        if issubclass(form_class, BackendFormMixin):
+            yield form_class
+
+
+class FormClassCacheTests(BackendTestCase):
+
+    url = '/backend_views/blogs/red/posts/first'
+
+    def setUp(self):
+        super(FormClassCacheTests, self).setUp()
+        form_class_cache.clear()
+        self.addCleanup(form_class_cache.clear)
+
+    def test_classes_are_shared_across_requests(self):
+        self.client.get(self.url)
+        cached = list(form_class_cache._data.values())
+        self.assertTrue(cached)
+        self.client.get(self.url)
+        self.assertEqual(list(form_class_cache._data.values()), cached)
+
+    def test_cached_classes_keep_no_view(self):
+        response = self.client.get(self.url)
+        self.assertContains(response, 'First')
+        wrappers = 0
+        for form_class in get_cached_form_classes():
+            for field in form_class.base_fields.values():
+                widget = field.widget
+                while widget is not None:
+                    if isinstance(widget, RelatedFieldWidgetWrapper):
+                        wrappers += 1
+                        self.assertIsNone(widget.controller)
+                        self.assertIsNone(widget.view_controller)
+                    elif isinstance(widget, AutocompleteSelect):
+                        self.assertIsNone(widget.related_controller)
+                    elif isinstance(widget, ForeignKeyRawIdWidget):
+                        self.assertIsNone(widget.view_controller)
+                    widget = getattr(widget, 'widget', None)
+        self.assertTrue(wrappers)
+
+    def test_overridden_formfield_hooks_are_not_cached(self):
+        view = self.client.get(self.url).context['view']
+        self.assertIsNotNone(view.get_form_class_cache_key('form', None, {}))
+
+        def formfield_for_foreignkey(self, db_field, **kwargs):
+            return super(type(self), self).formfield_for_foreignkey(
+                db_field, **kwargs)
+
+        view.__class__ = type(view.__class__.__name__, (view.__class__,), {
+            'formfield_for_foreignkey': formfield_for_foreignkey})
+        self.assertIsNone(view.get_form_class_cache_key('form', None, {}))
+        self.assertIsNone(view.get_form_class_cache_key(
+            'form', None, {'formfield_callback': lambda field, **kwargs: None}))
@@ -0,0 +1,45 @@
+from django.template import Context, Template
+from django.test import SimpleTestCase
+
+from foundation.template.engine import Engine
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class IncludeTests(SimpleTestCase):
+
+    source = ('{% for controller in controllers %}'
+              '{% include "bundled.html" with view_controller=controller %}|'
+              '{% endfor %}')
+
+    def setUp(self):
+        self.engine = Engine(app_dirs=True)
+        self.post = mock.Mock(app_label='backend_views', model_name='post')
+        self.blog = mock.Mock(app_label='backend_views', model_name='blog')
+
+    def render(self, *controllers):
+        template = Template(self.source, engine=self.engine)
+        output = template.render(Context({'controllers': controllers}))
+        return [part.strip() for part in output.split('|')[:-1]]
+
+    def test_include_is_resolved_for_each_view_controller(self):
+        # the post controller's override must not be served to the blog's
+        # rows, nor the generic template to the posts after it
+        self.assertEqual(self.render(self.post, self.blog, self.post),
+                         ['post override', 'generic', 'post override'])
+        self.assertEqual(self.render(self.blog, self.post),
+                         ['generic', 'post override'])
+
+    def test_resolutions_are_counted(self):
+        self.render(self.post, self.blog, self.post, self.blog)
+        self.assertEqual(self.engine.resolution_stats,
+                         {'hits': 2, 'misses': 2})
+
+    def test_resolutions_are_remembered_per_render(self):
+        self.render(self.post, self.post)
+        self.render(self.post, self.post)
+        self.assertEqual(self.engine.resolution_stats,
+                         {'hits': 2, 'misses': 2})
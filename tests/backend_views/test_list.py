@@ -0,0 +1,62 @@
+from django.contrib.sites.models import Site
+
+from .base import BackendTestCase
+from .controllers import PostController
+from .models import Blog, Post
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class ParentConstrainedListTests(BackendTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super(ParentConstrainedListTests, cls).setUpTestData()
+        other = Blog.objects.create(owner=cls.owner, slug='blue', title='Blue')
+        Post.objects.create(blog=other, slug='elsewhere', title='Elsewhere',
+                            body='Body')
+
+    def test_nested_list_counts_the_parents_children(self):
+        view = self.client.get('/backend_views/blogs/red/posts/').context['view']
+        self.assertEqual(view.result_count, 1)
+        self.assertEqual(view.full_result_count, 1)
+        self.assertEqual([post.slug for post in view.get_queryset()],
+                         ['first'])
+
+    def test_top_level_list_is_not_constrained(self):
+        view = self.client.get('/backend_views/blogs/').context['view']
+        self.assertIsNone(view.view_parent)
+        self.assertEqual(view.result_count, 2)
+
+
+@mock.patch.object(PostController, 'list_per_page', 100)
+class ListQueryTests(BackendTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super(ListQueryTests, cls).setUpTestData()
+        Post.objects.bulk_create([
+            Post(blog=cls.blog, slug='post-%s' % n, title='Post %s' % n,
+                 body='Body')
+            for n in range(49)
+        ])
+
+    def setUp(self):
+        super(ListQueryTests, self).setUp()
+        # cached by the sites framework after its first use
+        Site.objects.get_current()
+
+    def test_rows_and_their_relations_are_fetched_at_once(self):
+        # the URL's blog, the count and the 50 rows of the list formset with
+        # their blog column joined in
+        with self.assertNumQueries(3):
+            response = self.client.get('/backend_views/blogs/red/posts/')
+        view = response.context['view']
+        forms = view.formset.forms
+        self.assertEqual(len(forms), 50)
+        with self.assertNumQueries(0):
+            self.assertEqual({form.instance.blog.title for form in forms},
+                             {'Red'})
@@ -0,0 +1,97 @@
+import uuid
+
+from django.test import SimpleTestCase, override_settings
+from django.urls import Resolver404, resolve
+
+from foundation.backend import Backend, Controller, get_backend
+from foundation.backend import registry
+from foundation.backend.lookups import (
+    INTEGER_PATTERN, SLUG_PATTERN, UUID_PATTERN, ObjectLookup,
+)
+
+from .base import BackendTestCase
+from .models import Blog, Post, Tag
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class ObjectLookupTests(SimpleTestCase):
+
+    def test_pk_and_slug_are_looked_up_by_default(self):
+        lookup = get_backend().get_registered_controller(
+            Blog).get_registered_controller(Post).object_lookup
+        self.assertEqual([field.name for field in lookup.fields],
+                         ['id', 'slug'])
+        self.assertEqual(lookup.resolve('7'), {'id': 7})
+        self.assertEqual(lookup.resolve('first'), {'slug': 'first'})
+        self.assertIsNone(lookup.resolve('fir.st'))
+
+    def test_uuid_pk_is_matched_as_hex(self):
+        lookup = ObjectLookup(Tag, ('pk',))
+        self.assertEqual(lookup.pattern, UUID_PATTERN)
+        value = uuid.uuid4()
+        self.assertEqual(lookup.resolve(str(value)), {'id': value})
+        self.assertEqual(lookup.resolve(value.hex), {'id': value})
+        self.assertIsNone(lookup.resolve('first'))
+
+    def test_patterns_are_combined(self):
+        lookup = ObjectLookup(Blog, ('pk', 'slug'))
+        self.assertEqual(lookup.pattern, '(?:{}|{})'.format(INTEGER_PATTERN,
+                                                            SLUG_PATTERN))
+
+
+class SlugBlogController(Controller):
+
+    model = Blog
+    lookup_fields = ('slug',)
+
+
+class TagController(Controller):
+
+    model = Tag
+    lookup_fields = ('pk', 'name')
+
+
+@override_settings(DEBUG=True)
+class ControllerLookupTests(SimpleTestCase):
+
+    def setUp(self):
+        self.backend = Backend()
+        self.addCleanup(registry.system_check_errors.__delitem__, slice(None))
+        del registry.system_check_errors[:]
+
+    def test_declared_lookup_fields_are_used(self):
+        self.backend.register(Blog, SlugBlogController)
+        lookup = self.backend.get_registered_controller(Blog).object_lookup
+        self.assertEqual([field.name for field in lookup.fields], ['slug'])
+        self.assertEqual(lookup.pattern, SLUG_PATTERN)
+        # a number names a blog by its slug rather than its pk
+        self.assertEqual(lookup.resolve('7'), {'slug': '7'})
+        self.assertEqual(registry.check_controllers(), [])
+
+    def test_non_unique_lookup_field_is_an_error(self):
+        self.backend.register(Tag, TagController)
+        errors = registry.check_controllers()
+        self.assertEqual([error.id for error in errors], ['foundation.E001'])
+        self.assertIn('"name"', errors[0].msg)
+
+
+class LookupResolverTests(BackendTestCase):
+
+    def test_malformed_id_is_not_resolved(self):
+        self.assertEqual(
+            resolve('/backend_views/blogs/red/posts/first').kwargs,
+            {'backend_views_blog': 'red', 'backend_views_post': 'first'})
+        with self.assertRaises(Resolver404):
+            resolve('/backend_views/blogs/red/posts/fir.st')
+        with self.assertRaises(Resolver404):
+            resolve('/backend_views/blogs/r.ed/posts/first')
+
+    def test_malformed_id_is_rejected_before_the_view(self):
+        with mock.patch.object(ObjectLookup, 'resolve') as resolve_value:
+            response = self.client.get('/backend_views/blogs/red/posts/fir.st')
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(resolve_value.called)
@@ -0,0 +1,70 @@
+import gc
+import pickle
+
+from django.db.models import query
+
+from foundation.backend import get_backend
+from foundation.models import query as foundation_query
+from foundation.models.exceptions import AssociativeAttributeError
+
+from .base import BackendTestCase
+from .models import Blog
+
+
+class Owner(object):
+    """ Stands in for a controller, which holds its shared association. """
+
+
+class AssociationTests(BackendTestCase):
+
+    def setUp(self):
+        super(AssociationTests, self).setUp()
+        self.controller = get_backend().get_registered_controller(Blog)
+
+    def test_instances_reference_the_shared_association(self):
+        queryset = self.controller.get_associated_queryset()
+        association = queryset._association
+        self.assertIs(Blog.objects.associate(controller=self.controller)
+                      ._association, association)
+        blog = queryset.get()
+        self.assertIs(blog._association, association)
+        self.assertIs(blog.__dict__['_association_ref'], association.ref)
+        self.assertNotIn('_controller', blog.__dict__)
+        self.assertIs(blog._association.controller, self.controller)
+
+    def test_association_is_not_kept_alive_by_instances(self):
+        owner = Owner()
+        blog = Blog.objects.all().associate(controller=owner).get()
+        self.assertIs(blog._association.controller, owner)
+        del owner
+        gc.collect()
+        self.assertIsNone(blog._association)
+
+    def test_iterable_is_installed_only_on_associate(self):
+        self.assertIs(Blog.objects.all()._iterable_class, query.ModelIterable)
+        queryset = self.controller.get_associated_queryset()
+        self.assertIs(queryset._iterable_class, foundation_query.ModelIterable)
+        # values() and values_list() rows are not referenced
+        self.assertEqual(list(queryset.values_list('slug', flat=True)),
+                         ['red'])
+        self.assertEqual(list(queryset.values('slug')), [{'slug': 'red'}])
+        self.assertIs(queryset.values('slug')._iterable_class,
+                      query.ValuesIterable)
+
+    def test_pickling_drops_the_association(self):
+        blog = self.controller.get_associated_queryset().get()
+        restored = pickle.loads(pickle.dumps(blog))
+        self.assertEqual(restored, blog)
+        self.assertEqual(restored.title, 'Red')
+        self.assertNotIn('_association_ref', restored.__dict__)
+        self.assertIsNone(restored._association)
+        # the instance still holds its own association
+        self.assertIs(blog._association.controller, self.controller)
+
+    def test_unpickled_instances_can_be_associated_again(self):
+        blog = self.controller.get_associated_queryset().get()
+        restored = pickle.loads(pickle.dumps(blog))
+        with self.assertRaises(AssociativeAttributeError):
+            restored.view_controller
+        restored.associate(controller=self.controller)
+        self.assertIs(restored._association, blog._association)
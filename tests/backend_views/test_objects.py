@@ -0,0 +1,95 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from foundation.cache import track_model_version
+
+from .base import BackendTestCase
+from .controllers import BlogController, PostController
+from .models import Blog, Post
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class ViewParentObjectTests(BackendTestCase):
+
+    def get_view(self, url):
+        """ Returns the view and the SQL of its lookups of blogs by slug. """
+        with CaptureQueriesContext(connection) as queries:
+            view = self.client.get(url).context['view']
+        return view, [query['sql'] for query in queries
+                      if '"backend_views_blog"."slug" = ' in query['sql']]
+
+    def test_parent_is_fetched_with_the_object(self):
+        view, lookups = self.get_view('/backend_views/blogs/red/posts/first')
+        # the post's own query, constrained to the URL's blog
+        self.assertEqual(len(lookups), 1)
+        self.assertIn('FROM "backend_views_post"', lookups[0])
+        self.assertIs(view.view_parent.get_object(), view.get_object().blog)
+
+    def test_parent_with_its_own_queryset_is_fetched_by_itself(self):
+        get_root_queryset = BlogController.get_root_queryset
+
+        def get_hidden_queryset(controller):
+            return get_root_queryset(controller).exclude(title='Hidden')
+
+        with mock.patch.object(BlogController, 'get_root_queryset',
+                               get_hidden_queryset):
+            view, lookups = self.get_view(
+                '/backend_views/blogs/red/posts/first')
+        self.assertEqual(len(lookups), 2)
+        self.assertIsNot(view.view_parent.get_object(), view.get_object().blog)
+
+    def test_parent_of_a_list_is_fetched_once(self):
+        view, lookups = self.get_view('/backend_views/blogs/red/posts/')
+        self.assertEqual(len(lookups), 1)
+        self.assertEqual(view.view_parent.get_object(), self.blog)
+
+    def test_object_of_another_parent_is_not_found(self):
+        Blog.objects.create(owner=self.owner, slug='blue', title='Blue')
+        response = self.client.get('/backend_views/blogs/blue/posts/first')
+        self.assertEqual(response.status_code, 404)
+
+
+@mock.patch.object(PostController, 'object_cache_timeout', 60)
+class ObjectCacheTests(BackendTestCase):
+
+    url = '/backend_views/blogs/red/posts/first'
+
+    @classmethod
+    def setUpClass(cls):
+        super(ObjectCacheTests, cls).setUpClass()
+        track_model_version(Blog)
+        track_model_version(Post)
+
+    def get_post(self):
+        return self.client.get(self.url).context['view'].get_object()
+
+    def test_object_is_not_served_under_a_renamed_parent(self):
+        self.get_post()
+        self.blog.slug = 'crimson'
+        self.blog.save()
+        self.assertEqual(self.client.get(self.url).status_code, 404)
+
+    def test_object_is_cached_until_it_changes(self):
+        self.get_post()
+        with CaptureQueriesContext(connection) as queries:
+            self.get_post()
+        self.assertFalse([query for query in queries
+                          if '"backend_views_post"."slug" = ' in query['sql']])
+        self.post.title = 'Renamed'
+        self.post.save()
+        self.assertEqual(self.get_post().title, 'Renamed')
+
+    def test_cached_object_does_not_carry_its_parent(self):
+        # e.g. a manager which always selects the blog
+        get_queryset = Post.objects.get_queryset
+        with mock.patch.object(
+                Post.objects, 'get_queryset',
+                lambda: get_queryset().select_related('blog')):
+            self.assertEqual(self.get_post().blog.title, 'Red')
+            self.blog.title = 'Renamed'
+            self.blog.save()
+            self.assertEqual(self.get_post().blog.title, 'Renamed')
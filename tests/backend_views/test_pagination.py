@@ -0,0 +1,204 @@
+from django.contrib.auth.models import User
+from django.core.exceptions import ImproperlyConfigured
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
+
+from foundation.backend.paginator import CursorPaginator, Paginator
+from foundation.templatetags.list import paginator_number
+
+from .base import BackendTestCase
+from .controllers import PostController
+from .models import Blog, Post
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class PostsTestCase(BackendTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super(PostsTestCase, cls).setUpTestData()
+        for n in range(2, 6):
+            Post.objects.create(blog=cls.blog, slug='post-%s' % n,
+                                title='Post %s' % n, body='Body')
+        other = Blog.objects.create(owner=cls.owner, slug='blue', title='Blue')
+        Post.objects.create(blog=other, slug='elsewhere', title='Elsewhere',
+                            body='Body')
+
+
+@mock.patch.object(PostController, 'list_per_page', 2)
+class NestedListPaginationTests(PostsTestCase):
+
+    def get_page(self, page):
+        return self.client.get('/backend_views/blogs/red/posts/',
+                               {'p': page}).context['view']
+
+    def test_formset_shows_the_page(self):
+        pages = [self.get_page(n) for n in (1, 2, 3)]
+        slugs = [[post.slug for post in view.formset.get_queryset()]
+                 for view in pages]
+        self.assertEqual(slugs, [['first', 'post-2'], ['post-3', 'post-4'],
+                                 ['post-5']])
+        self.assertEqual([len(view.formset.forms) for view in pages],
+                         [2, 2, 1])
+
+    def test_page_is_selected_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.get_page(2)
+        selects = [query['sql'] for query in queries
+                   if 'FROM "backend_views_post"' in query['sql']]
+        self.assertEqual(
+            len([sql for sql in selects if 'COUNT(' in sql]), 1)
+        self.assertEqual(
+            len([sql for sql in selects if 'LIMIT' in sql]), 1)
+
+
+@mock.patch.object(PostController, 'list_per_page', 2)
+class CountStrategyTests(PostsTestCase):
+
+    def get_view(self, page=1):
+        response = self.client.get('/backend_views/blogs/red/posts/',
+                                   {'p': page})
+        self.assertEqual(response.status_code, 200)
+        return response.context['view']
+
+    def slugs(self, view):
+        return [post.slug for post in view.formset.get_queryset()]
+
+    def test_exact_count(self):
+        view = self.get_view()
+        self.assertEqual((view.result_count, view.result_count_is_exact),
+                         (5, True))
+        self.assertEqual(view.result_count_display, '5')
+
+    @mock.patch.object(PostController, 'count_strategy', 'capped')
+    @mock.patch.object(PostController, 'count_cap', 2)
+    def test_capped_count(self):
+        view = self.get_view()
+        self.assertEqual((view.result_count, view.result_count_is_exact),
+                         (3, False))
+        self.assertEqual(view.result_count_display, '2+')
+        self.assertFalse(view.paginator.count_is_exact)
+        self.assertFalse(view.can_show_all)
+
+    @mock.patch.object(PostController, 'count_strategy', 'capped')
+    @mock.patch.object(PostController, 'count_cap', 2)
+    def test_capped_count_serves_pages_past_the_cap(self):
+        self.assertEqual(self.slugs(self.get_view(3)), ['post-5'])
+        past = self.get_view(9)
+        self.assertEqual(self.slugs(past), [])
+        self.assertFalse(past.page.has_next())
+
+    @mock.patch.object(PostController, 'count_strategy', 'capped')
+    @mock.patch.object(PostController, 'count_cap', 10)
+    def test_capped_count_under_the_cap_is_exact(self):
+        view = self.get_view()
+        self.assertEqual((view.result_count, view.result_count_is_exact),
+                         (5, True))
+        self.assertEqual(view.result_count_display, '5')
+
+    @mock.patch.object(PostController, 'count_strategy', 'estimate')
+    @mock.patch.object(PostController, 'count_cap', 2)
+    def test_estimate_falls_back_to_a_capped_count(self):
+        # SQLite has no planner estimate
+        view = self.get_view()
+        self.assertIsNone(view.get_estimated_count(view.root_queryset))
+        self.assertEqual((view.result_count, view.result_count_is_exact),
+                         (3, False))
+        self.assertEqual(view.result_count_display, '2+')
+
+    @mock.patch.object(PostController, 'count_cap', 2)
+    def test_estimates_are_rendered_as_many(self):
+        view = self.get_view()
+        self.assertEqual(view.format_count(5000, False), 'many')
+        self.assertEqual(view.format_count(None, True), '')
+
+
+class PaginatorTests(SimpleTestCase):
+
+    def test_exact_count_rejects_pages_past_the_end(self):
+        paginator = Paginator(list(range(5)), 2)
+        self.assertTrue(paginator.count_is_exact)
+        self.assertFalse(paginator.page(3).has_next())
+        with self.assertRaises(EmptyPage):
+            paginator.page(4)
+
+    def test_inexact_count_serves_pages_past_the_count(self):
+        paginator = Paginator(list(range(5)), 2)
+        paginator.set_count(3, exact=False)
+        self.assertFalse(paginator.count_is_exact)
+        self.assertEqual(paginator.num_pages, 2)
+        # a full page may be followed by another
+        self.assertTrue(paginator.page(2).has_next())
+        self.assertEqual(list(paginator.page(3)), [4])
+        self.assertFalse(paginator.page(3).has_next())
+        self.assertEqual(list(paginator.page(4)), [])
+        with self.assertRaises(EmptyPage):
+            paginator.page(0)
+        with self.assertRaises(PageNotAnInteger):
+            paginator.page('last')
+
+    def test_end_class_needs_an_exact_count(self):
+        paginator = Paginator(list(range(5)), 2)
+        view = mock.Mock(page=paginator.page(1))
+        view.get_query_string.return_value = '?p=2'
+        self.assertIn('class="end"', paginator_number(view, 2))
+        paginator.set_count(5, exact=False)
+        self.assertNotIn('class="end"', paginator_number(view, 2))
+
+
+@mock.patch.object(PostController, 'list_per_page', 2)
+@mock.patch.object(PostController, 'paginator_class', CursorPaginator)
+class CursorPaginationTests(PostsTestCase):
+
+    def get_page(self, cursor=None):
+        params = {'c': cursor} if cursor else {}
+        return self.client.get('/backend_views/blogs/red/posts/',
+                               params).context['view']
+
+    def slugs(self, view):
+        return [post.slug for post in view.formset.get_queryset()]
+
+    def test_pages_forwards_and_backwards(self):
+        first = self.get_page()
+        self.assertEqual(self.slugs(first), ['first', 'post-2'])
+        self.assertFalse(first.page.has_previous())
+
+        second = self.get_page(first.page.next_cursor)
+        self.assertEqual(self.slugs(second), ['post-3', 'post-4'])
+        last = self.get_page(second.page.next_cursor)
+        self.assertEqual(self.slugs(last), ['post-5'])
+        self.assertFalse(last.page.has_next())
+
+        back = self.get_page(last.page.previous_cursor)
+        self.assertEqual(self.slugs(back), ['post-3', 'post-4'])
+        self.assertTrue(back.page.has_next())
+        start = self.get_page(back.page.previous_cursor)
+        self.assertEqual(self.slugs(start), ['first', 'post-2'])
+        self.assertFalse(start.page.has_previous())
+
+    def test_page_rows_are_fetched_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            view = self.get_page(self.get_page().page.next_cursor)
+        self.assertIsInstance(view.page.object_list, list)
+        selects = [query['sql'] for query in queries
+                   if 'FROM "backend_views_post"' in query['sql']
+                   and 'COUNT(' not in query['sql']]
+        # one page select for each of the two requests
+        self.assertEqual(len(selects), 2)
+
+    def test_invalid_cursor_serves_the_first_page(self):
+        self.assertEqual(self.slugs(self.get_page('bogus')),
+                         ['first', 'post-2'])
+
+
+class CursorPaginatorTests(SimpleTestCase):
+
+    def test_nullable_ordering_is_rejected(self):
+        with self.assertRaises(ImproperlyConfigured):
+            CursorPaginator(User.objects.order_by('last_login'), 10)
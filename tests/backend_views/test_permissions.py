@@ -0,0 +1,77 @@
+from django.contrib.auth.models import User
+
+from foundation.backend.views.controller.accessor import ModelPermissionsMixin
+
+from .base import BackendTestCase
+from .models import Blog
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class PermissionsTests(BackendTestCase):
+
+    def setUp(self):
+        super(PermissionsTests, self).setUp()
+        get_permissions = ModelPermissionsMixin.get_permissions
+        patcher = mock.patch.object(ModelPermissionsMixin, 'get_permissions',
+                                    autospec=True, side_effect=get_permissions)
+        self.get_permissions = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_calls(self):
+        return sorted(
+            (accessor.controller.model.__name__,
+             accessor.get_permissions_model().__name__)
+            for (accessor,), kwargs in self.get_permissions.call_args_list)
+
+    def test_computed_once_per_controller_and_model(self):
+        self.client.force_login(self.owner)
+        view = self.client.get(
+            '/backend_views/blogs/red/posts/first').context['view']
+        for mode in ('list', 'display', 'edit'):
+            view.has_permission(mode)
+            view.view_parent.has_permission(mode)
+        self.assertEqual(self.get_calls(),
+                         [('Blog', 'Blog'), ('Post', 'Post')])
+
+    def test_shared_across_view_controllers_of_a_controller(self):
+        view = self.client.get('/backend_views/blogs/red').context['view']
+        child = view.view_children['blog_entries']
+        permissions = child.permissions
+        del view.__dict__['view_children']
+        other = view.view_children['blog_entries']
+        self.assertIsNot(other, child)
+        self.assertIs(other.permissions, permissions)
+        self.assertEqual(self.get_calls().count(('Post', 'Post')), 1)
+
+    def test_uncontrolled_models_are_only_listed(self):
+        view = self.client.get('/backend_views/blogs/').context['view']
+        with mock.patch.object(type(view), 'get_permissions_model',
+                               return_value=User):
+            self.assertEqual(view.get_permissions(), ['list'])
+
+
+class ObjectPermissionTests(BackendTestCase):
+
+    def test_candidates_are_resolved_once_the_formset_exists(self):
+        other = User.objects.create_user('ann')
+        Blog.objects.create(owner=other, slug='blue', title='Blue')
+        self.client.force_login(self.owner)
+        view = self.client.get('/backend_views/blogs/').context['view']
+
+        # candidates asked for before the formset exists are not known yet
+        formset = view.__dict__.pop('formset')
+        self.assertIsNone(view.permission_candidates)
+        view.formset = formset
+
+        view.__dict__['permissions'] = frozenset(('list', 'display', 'edit'))
+        blogs = list(formset.get_queryset())
+        self.assertEqual(len(blogs), 2)
+        with self.assertNumQueries(1):
+            permitted = [view.has_object_permission(blog, 'edit')
+                         for blog in blogs]
+        self.assertEqual(permitted,
+                         [blog.owner_id == self.owner.pk for blog in blogs])
@@ -0,0 +1,152 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from foundation.backend.search import IndexSearchBackend, InvertedIndex
+from foundation.cache import VERSION_KEY
+
+from .base import BackendTestCase
+from .controllers import BlogController, PostController
+from .models import Blog, Post
+
+try:
+    from unittest import mock
+except ImportError:  # Python 2
+    import mock
+
+
+class InvertedIndexTests(BackendTestCase):
+
+    def setUp(self):
+        super(InvertedIndexTests, self).setUp()
+        self.index = InvertedIndex.get_index(Post, ('title', 'body'))
+        self.assertEqual(self.index.search(['first']), [self.post.pk])
+
+    def test_own_writes_update_the_index_in_place(self):
+        with mock.patch.object(self.index, 'rebuild') as rebuild:
+            self.post.title = 'Renamed'
+            self.post.save()
+            second = Post.objects.create(blog=self.blog, slug='second',
+                                         title='Renamed too', body='Body')
+            self.assertEqual(self.index.search(['renamed']),
+                             [self.post.pk, second.pk])
+            second.delete()
+            self.assertEqual(self.index.search(['renamed']), [self.post.pk])
+        self.assertFalse(rebuild.called)
+
+    def test_other_writers_cause_a_rebuild(self):
+        # another process's save bumps the shared version without the signals
+        # of this one reaching the index
+        Post.objects.filter(pk=self.post.pk).update(title='Renamed',
+                                                    body='Body')
+        cache.incr(VERSION_KEY.format(Post._meta.label_lower))
+        self.assertEqual(self.index.search(['renamed']), [self.post.pk])
+        self.assertEqual(self.index.search(['first']), [])
+
+    def test_unsignalled_writes_are_missed_until_the_version_moves(self):
+        Post.objects.filter(pk=self.post.pk).update(title='Renamed')
+        self.assertEqual(self.index.search(['renamed']), [])
+        cache.clear()
+        self.assertEqual(self.index.search(['renamed']), [self.post.pk])
+
+
+@mock.patch.object(PostController, 'search_backend',
+                   property(lambda controller: IndexSearchBackend(controller)))
+class IndexSearchBackendTests(BackendTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super(IndexSearchBackendTests, cls).setUpTestData()
+        Post.objects.create(blog=cls.blog, slug='second', title='Wow!!!',
+                            body='Second body')
+        Post.objects.create(blog=cls.blog, slug='third', title='Firsthand first',
+                            body='Body')
+
+    def search(self, query):
+        view = self.client.get('/backend_views/blogs/red/posts/',
+                               {'q': query}).context['view']
+        self.assertIsInstance(view.controller.search_backend,
+                              IndexSearchBackend)
+        return [post.slug for post in view.formset.get_queryset()]
+
+    def test_matches_word_prefixes_by_rank(self):
+        # two matching words outrank one
+        self.assertEqual(self.search('firs'), ['third', 'first'])
+        self.assertEqual(self.search('hand'), [])
+
+    def test_follows_saves(self):
+        self.assertEqual(self.search('renamed'), [])
+        self.post.title = 'Renamed'
+        self.post.save()
+        self.assertEqual(self.search('renamed'), ['first'])
+
+    def test_terms_without_tokens_are_searched_through_the_orm(self):
+        self.assertEqual(self.search('!!!'), ['second'])
+
+
+class SearchLookupTests(BackendTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super(SearchLookupTests, cls).setUpTestData()
+        Post.objects.create(blog=cls.blog, slug='five', title='Five stars',
+                            body='Body', rating=5, published=datetime.datetime(
+                                2020, 1, 2, 12, 0))
+        Post.objects.create(blog=cls.blog, slug='fifteen', title='Fifteen',
+                            body='Body', rating=15, published=datetime.datetime(
+                                2020, 1, 3, 12, 0))
+
+    def search(self, **params):
+        view = self.client.get('/backend_views/blogs/red/posts/',
+                               params).context['view']
+        return [post.slug for post in view.formset.get_queryset()]
+
+    @mock.patch.object(PostController, 'search_fields', ('title', 'rating'))
+    def test_numbers_are_matched_exactly(self):
+        # not by icontains, which would match 15 too
+        self.assertEqual(self.search(q='5'), ['five'])
+        self.assertEqual(self.search(q='15'), ['fifteen'])
+        # terms that are not numbers still search the text fields
+        self.assertEqual(self.search(q='fif'), ['fifteen'])
+
+    @mock.patch.object(PostController, 'search_fields', ('title', 'published'))
+    def test_datetimes_are_matched_by_date(self):
+        self.assertEqual(self.search(q='2020-01-02'), ['five'])
+        self.assertEqual(self.search(q='2020-01-04'), [])
+        self.assertEqual(self.search(q='stars'), ['five'])
+
+    @mock.patch.object(PostController, 'search_by_field', True)
+    @mock.patch.object(PostController, 'search_fields', ('title', 'rating'))
+    def test_search_by_field_applies_every_field(self):
+        self.assertEqual(self.search(title='fi'), ['first', 'five', 'fifteen'])
+        self.assertEqual(self.search(title='fi', rating='15'), ['fifteen'])
+        self.assertEqual(self.search(rating='5'), ['five'])
+        self.assertEqual(self.search(title='fi', rating='many'), [])
+
+
+@mock.patch.object(BlogController, 'search_fields',
+                   ('title', 'blog_entries__title'))
+class DeduplicationTests(BackendTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        super(DeduplicationTests, cls).setUpTestData()
+        Post.objects.create(blog=cls.blog, slug='again', title='First again',
+                            body='Body')
+        Blog.objects.create(owner=cls.owner, slug='blue', title='Blue')
+
+    def test_multi_valued_matches_are_listed_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            view = self.client.get('/backend_views/blogs/',
+                                   {'q': 'first'}).context['view']
+        self.assertEqual([blog.slug for blog in view.formset.get_queryset()],
+                         ['red'])
+        self.assertEqual(view.result_count, 1)
+        selects = [query['sql'] for query in queries
+                   if query['sql'].startswith('SELECT "backend_views_blog"')]
+        self.assertTrue(selects)
+        for sql in selects:
+            self.assertNotIn('DISTINCT', sql)
+            self.assertIn('"backend_views_blog"."id" IN (SELECT', sql)
@@ -0,0 +1,17 @@
+from django.contrib.sites.models import Site
+from django.test import TestCase
+
+from foundation.backend import get_backend
+
+
+class SiteTests(TestCase):
+
+    def test_site_title_follows_site_changes(self):
+        backend = get_backend()
+        self.assertEqual(backend.site_title, 'example.com')
+        with self.assertNumQueries(0):
+            backend.site_title
+        site = Site.objects.get_current()
+        site.name = 'Renamed'
+        site.save()
+        self.assertEqual(backend.site_title, 'Renamed')
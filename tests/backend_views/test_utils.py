@@ -0,0 +1,38 @@
+from django.test import SimpleTestCase
+
+from foundation.utils import get_composed_class
+
+from .base import BackendTestCase
+
+
+class Base(object):
+    pass
+
+
+class ComposedClassTests(SimpleTestCase):
+
+    def test_repeated_composition_returns_the_same_class(self):
+        composed = get_composed_class('Composed', (Base,), {'mode': 'list'})
+        self.assertTrue(issubclass(composed, Base))
+        self.assertEqual(composed.mode, 'list')
+        self.assertIs(get_composed_class('Composed', (Base,), {'mode': 'list'}),
+                      composed)
+        self.assertIsNot(
+            get_composed_class('Composed', (Base,), {'mode': 'edit'}),
+            composed)
+
+    def test_unhashable_attributes_are_composed_each_time(self):
+        composed = get_composed_class('Composed', (Base,), {'modes': ['list']})
+        self.assertEqual(composed.modes, ['list'])
+        self.assertIsNot(
+            get_composed_class('Composed', (Base,), {'modes': ['list']}),
+            composed)
+
+
+class ComposedViewClassTests(BackendTestCase):
+
+    def test_view_classes_are_composed_once(self):
+        views = [self.client.get('/backend_views/blogs/red/posts/')
+                 .context['view'] for n in range(2)]
+        self.assertIsNot(views[0], views[1])
+        self.assertIs(type(views[0].view_parent), type(views[1].view_parent))
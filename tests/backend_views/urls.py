@@ -0,0 +1,3 @@
+from foundation.backend import get_backend
+
+urlpatterns = get_backend().urls
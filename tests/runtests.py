@@ -53,6 +53,7 @@ ALWAYS_INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.admin.apps.SimpleAdminConfig',
     'django.contrib.staticfiles',
+    'foundation',
 ]
 
 ALWAYS_MIDDLEWARE = [
@@ -138,6 +139,8 @@ def setup(verbosity, test_labels, parallel):
     }]
     settings.LANGUAGE_CODE = 'en'
     settings.SITE_ID = 1
+    # the default backend also serves the "embed" route
+    settings.FOUNDATION_BACKEND = 'backend_views.apps.TestBackend'
     settings.MIDDLEWARE = ALWAYS_MIDDLEWARE
     settings.MIGRATION_MODULES = {
         # This lets us skip creating migrations for the test models as many of
@@ -0,0 +1,22 @@
+from django.test import SimpleTestCase
+
+from foundation.template.index import TemplateIndex, get_template_index
+
+# this module is imported once the apps are set up but before any test (some
+# of which render templates and so scan the shared index) has run
+scanned_at_startup = get_template_index().names is not None
+
+
+class TemplateIndexTests(SimpleTestCase):
+
+    def test_startup_does_not_scan_templates(self):
+        self.assertFalse(scanned_at_startup)
+
+    def test_scanned_on_first_use(self):
+        index = TemplateIndex()
+        self.assertIsNone(index.names)
+        paths = index.get_paths('list.html', app_label='backend_views',
+                                model_name='post')
+        self.assertIsNotNone(index.names)
+        self.assertTrue(paths)
+        self.assertTrue(all(path.endswith('list.html') for path in paths))
@@ -0,0 +1,28 @@
+from django.test import SimpleTestCase
+
+from foundation.template.engine import Engine
+from foundation.template.loaders import app_directories, cached, filesystem
+
+
+class DefaultLoaderTests(SimpleTestCase):
+
+    def get_loader_classes(self, loaders):
+        return [type(loader) for loader in loaders]
+
+    def test_foundation_loaders_are_cached(self):
+        loaders = Engine(app_dirs=True).template_loaders
+        self.assertEqual(self.get_loader_classes(loaders), [cached.Loader])
+        self.assertEqual(self.get_loader_classes(loaders[0].loaders),
+                         [filesystem.Loader, app_directories.Loader])
+
+    def test_debug_loaders_are_not_cached(self):
+        loaders = Engine(app_dirs=True, debug=True).template_loaders
+        self.assertEqual(self.get_loader_classes(loaders),
+                         [filesystem.Loader, app_directories.Loader])
+
+    def test_configured_loaders_are_kept(self):
+        loaders = Engine(loaders=[
+            'django.template.loaders.filesystem.Loader']).template_loaders
+        self.assertEqual([loader.__module__ for loader in loaders],
+                         ['django.template.loaders.filesystem'])
+